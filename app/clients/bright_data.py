@@ -1,6 +1,7 @@
 """Bright Data SERP API client."""
 
 import asyncio
+import functools
 import json
 import logging
 from typing import Dict, Any, Optional, List
@@ -15,6 +16,29 @@ from app.parsers.google_serp_parser import GoogleSERPParser
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=128)
+def _google_url_template(country: str, language: str, results_per_page: int):
+    """
+    Build the formatter for one (country, language, results_per_page) shape.
+    
+    Only the query and start index vary between calls with the same shape, so
+    the rest of the URL is rendered once and reused.
+    """
+    return (
+        "https://www.google.com/search?q={q}"
+        f"&gl={country.lower()}&hl={language}&start={{start}}&num={results_per_page}"
+    ).format
+
+
+@functools.lru_cache(maxsize=1024)
+def _build_google_url_cached(
+    query: str, start: int, results_per_page: int, country: str, language: str
+) -> str:
+    """Build the full URL for one page of one query; repeats (retries, re-run batches) skip quoting."""
+    template = _google_url_template(country, language, results_per_page)
+    return template(q=quote(query), start=start)
+
+
 class BrightDataError(Exception):
     """Base exception for Bright Data API errors."""
     pass
@@ -110,16 +134,13 @@ class BrightDataClient:
         Returns:
             Formatted Google search URL
         """
-        base_url = "https://www.google.com/search"
-        params = [
-            f"q={quote(search_request.query)}",
-            f"gl={search_request.country.lower()}",
-            f"hl={search_request.language}",
-            f"start={max(0, (search_request.page - 1) * search_request.results_per_page)}",
-            f"num={search_request.results_per_page}"
-        ]
-        
-        return f"{base_url}?{'&'.join(params)}"
+        return _build_google_url_cached(
+            search_request.query,
+            max(0, (search_request.page - 1) * search_request.results_per_page),
+            search_request.results_per_page,
+            search_request.country,
+            search_request.language
+        )
     
     async def _make_request_with_retry(self, payload: Dict[str, Any]) -> str:
         """
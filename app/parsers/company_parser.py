@@ -13,6 +13,11 @@ from typing import List, Dict, Any, Optional, Tuple, Set
 from urllib.parse import urljoin, urlparse
 from bs4 import BeautifulSoup, Tag
 
+try:
+    import re2
+except ImportError:  # google-re2 is optional; fall back to the stdlib engine
+    re2 = None
+
 from app.models.company import (
     CompanyInformation, CompanyBasicInfo, CompanyContact, CompanySocial,
     CompanyFinancials, CompanyKeyPersonnel, SocialPlatformType, 
@@ -22,6 +27,27 @@ from app.models.company import (
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Patterns used on every email/phone candidate, compiled once at import
+_VALID_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_NON_PHONE_CHARS_RE = re.compile(r'[^\d+]')
+
+
+def _compile_linear(pattern: str, ignore_case: bool = False):
+    """
+    Compile a pattern with RE2 when available, otherwise with ``re``.
+    
+    RE2 matches in linear time, so hostile hrefs and page text cannot trigger
+    catastrophic backtracking. Patterns RE2 rejects fall back to ``re``.
+    """
+    if re2 is not None:
+        options = re2.Options()
+        options.case_sensitive = not ignore_case
+        try:
+            return re2.compile(pattern, options)
+        except re2.error:
+            logger.debug(f"RE2 cannot compile {pattern!r}; using re")
+    return re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+
 
 class CompanyInformationParser:
     """
@@ -33,8 +59,9 @@ class CompanyInformationParser:
     
     # Email patterns with exclusion filters
     EMAIL_PATTERNS = [
-        # Standard email pattern
-        r'\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b',
+        # Standard email pattern (local part and domain capped at their RFC 5321 lengths
+        # so long dotted runs cannot make each start position scan the whole text)
+        r'\b[a-zA-Z0-9._%+-]{1,64}@[a-zA-Z0-9.-]{1,253}\.[a-zA-Z]{2,63}\b',
     ]
     
     # Email patterns to exclude (common non-business emails)
@@ -84,14 +111,15 @@ class CompanyInformationParser:
         ],
     }
     
-    # Address pattern keywords and indicators
+    # Address pattern keywords and indicators (runs are length-capped so that text
+    # with many digit-led start positions stays linear instead of quadratic)
     ADDRESS_PATTERNS = [
         # Street address patterns
-        r'\d+\s+[A-Za-z0-9\s,.-]+(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Boulevard|Blvd|Lane|Ln|Way|Plaza|Place|Pl|Court|Ct)',
+        r'\d{1,6}\s+[A-Za-z0-9\s,.-]{1,100}(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Boulevard|Blvd|Lane|Ln|Way|Plaza|Place|Pl|Court|Ct)',
         # P.O. Box patterns
-        r'(?:P\.?O\.?\s+)?Box\s+\d+',
+        r'(?:P\.?O\.?\s+)?Box\s+\d{1,10}',
         # General address with city, state patterns
-        r'\d+\s+[^,\n]+,\s*[A-Za-z\s]+,?\s*[A-Z]{2}\s*\d{5}(?:-\d{4})?',
+        r'\d{1,6}\s+[^,\n]{1,100},\s*[A-Za-z\s]{1,50},?\s*[A-Z]{2}\s*\d{5}(?:-\d{4})?',
     ]
     
     # CSS selectors for different content types
@@ -175,17 +203,38 @@ class CompanyInformationParser:
         
     def _compile_patterns(self):
         """Compile regex patterns for better performance."""
-        self.compiled_email_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in self.EMAIL_PATTERNS]
-        self.compiled_email_exclusions = [re.compile(pattern, re.IGNORECASE) for pattern in self.EMAIL_EXCLUSIONS]
-        self.compiled_phone_patterns = [re.compile(pattern) for pattern in self.PHONE_PATTERNS]
-        self.compiled_address_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in self.ADDRESS_PATTERNS]
+        self.compiled_email_patterns = [_compile_linear(pattern, ignore_case=True) for pattern in self.EMAIL_PATTERNS]
+        self.compiled_phone_patterns = [_compile_linear(pattern) for pattern in self.PHONE_PATTERNS]
+        self.compiled_address_patterns = [_compile_linear(pattern, ignore_case=True) for pattern in self.ADDRESS_PATTERNS]
+        
+        # Single alternation of all exclusions so each email is checked in one pass
+        self.compiled_email_exclusion = _compile_linear(
+            '|'.join(f'(?:{pattern})' for pattern in self.EMAIL_EXCLUSIONS), ignore_case=True
+        )
         
         # Compile social media patterns
         self.compiled_social_patterns = {}
         for platform, patterns in self.SOCIAL_PATTERNS.items():
             self.compiled_social_patterns[platform] = [
-                re.compile(pattern, re.IGNORECASE) for pattern in patterns
+                _compile_linear(pattern, ignore_case=True) for pattern in patterns
             ]
+        
+        # Union of every social pattern, classifying a link in one scan. Each
+        # alternative is wrapped in its own group, so alternative i owns groups
+        # 2i+1 (whole match) and 2i+2 (username).
+        self.social_classifier_platforms = [
+            platform
+            for platform, patterns in self.SOCIAL_PATTERNS.items()
+            for _ in patterns
+        ]
+        self.compiled_social_classifier = _compile_linear(
+            '|'.join(
+                f'({pattern})'
+                for patterns in self.SOCIAL_PATTERNS.values()
+                for pattern in patterns
+            ),
+            ignore_case=True
+        )
     
     def extract_company_information(
         self,
@@ -628,13 +677,7 @@ class CompanyInformationParser:
                 email = match.lower().strip()
                 
                 # Check exclusion patterns
-                excluded = False
-                for exclusion in self.compiled_email_exclusions:
-                    if exclusion.match(email):
-                        excluded = True
-                        break
-                
-                if not excluded:
+                if not self.compiled_email_exclusion.match(email):
                     # Basic email format validation
                     if self._is_valid_email(email):
                         emails.add(email)
@@ -643,10 +686,7 @@ class CompanyInformationParser:
     
     def _is_valid_email(self, email: str) -> bool:
         """Basic email validation using regex."""
-        email_pattern = re.compile(
-            r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        )
-        return bool(email_pattern.match(email))
+        return bool(_VALID_EMAIL_RE.match(email))
     
     def _extract_phone_numbers(self, text: str) -> List[str]:
         """Extract and validate phone numbers from text."""
@@ -658,7 +698,7 @@ class CompanyInformationParser:
                 phone = match.strip()
                 
                 # Basic validation
-                clean_phone = re.sub(r'[^\d+]', '', phone)
+                clean_phone = _NON_PHONE_CHARS_RE.sub('', phone)
                 if len(clean_phone) >= 7:  # Minimum reasonable length
                     phones.add(phone)
         
@@ -717,31 +757,32 @@ class CompanyInformationParser:
             if not href or href.startswith('#'):
                 continue
             
-            # Check each platform pattern
-            for platform, patterns in self.compiled_social_patterns.items():
-                for pattern in patterns:
-                    match = pattern.search(href)
-                    if match and href not in found_urls:
-                        try:
-                            # Extract username if available
-                            username = match.group(1) if match.groups() else None
-                            
-                            # Create social profile
-                            social_profile = CompanySocial(
-                                platform=platform,
-                                url=href,
-                                username=username
-                            )
-                            
-                            social_profiles.append(social_profile)
-                            found_urls.add(href)
-                            break
-                        except Exception as e:
-                            logger.debug(f"Error creating social profile for {href}: {e}")
-                            continue
+            if href in found_urls:
+                continue
+            
+            # One scan both rules out non-social links and identifies the platform
+            match = self.compiled_social_classifier.search(href)
+            if not match:
+                continue
+            
+            groups = match.groups()
+            index = next(
+                i for i in range(len(self.social_classifier_platforms))
+                if groups[2 * i] is not None
+            )
+            
+            try:
+                # Create social profile
+                social_profile = CompanySocial(
+                    platform=self.social_classifier_platforms[index],
+                    url=href,
+                    username=groups[2 * index + 1]
+                )
                 
-                if href in found_urls:
-                    break
+                social_profiles.append(social_profile)
+                found_urls.add(href)
+            except Exception as e:
+                logger.debug(f"Error creating social profile for {href}: {e}")
         
         logger.debug(f"Found {len(social_profiles)} social media profiles")
         return social_profiles
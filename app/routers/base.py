@@ -1,7 +1,7 @@
 """Base router utilities for common patterns."""
 
 import logging
-from typing import Dict, Any
+from typing import Callable, Dict, Any
 from fastapi import APIRouter
 
 from app.services.serp_service import SERPService
@@ -23,6 +23,11 @@ class BaseHandler:
         async with SERPService() as service:
             yield service
     
+    @staticmethod
+    def get_serp_service_factory() -> Callable[[], SERPService]:
+        """Dependency injection for constructing SERP services on demand (e.g. health checks)."""
+        return SERPService
+    
     @staticmethod
     async def get_batch_pagination_service() -> BatchPaginationService:
         """Dependency injection for batch pagination service with standardized async context management."""
@@ -3,7 +3,7 @@
 import logging
 from fastapi import APIRouter, Depends, status
 from fastapi.responses import JSONResponse
-from typing import Dict, Any
+from typing import Callable, Dict, Any
 
 from app.models.serp import SearchRequest, SearchResponse, BatchPaginationResponse
 from app.services.serp_service import SERPService
@@ -26,6 +26,7 @@ handler = BaseHandler(router)
 
 # Use base handler dependencies
 get_serp_service = handler.get_serp_service
+get_serp_service_factory = handler.get_serp_service_factory
 get_batch_pagination_service = handler.get_batch_pagination_service
 
 
@@ -126,11 +127,13 @@ async def unified_search(
     summary="Check Search API Status",
     description="Check the health and availability of the search API and its dependencies"
 )
-async def search_status():
+async def search_status(
+    service_factory: Callable[[], SERPService] = Depends(get_serp_service_factory)
+):
     """Check search API status and dependencies."""
     try:
         # Try to initialize service to check if it's working
-        serp_service = SERPService()
+        serp_service = service_factory()
         
         return {
             "service": "search_api",
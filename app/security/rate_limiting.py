@@ -13,7 +13,7 @@ import time
 from collections import defaultdict, deque
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, List, Optional, Set, Tuple, Union
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
 from ipaddress import ip_address, ip_network
 
 import aioredis
@@ -320,11 +320,9 @@ class AbuseDetector:
         
         return min(score, 1.0)
     
-    def record_request(self, client_ip: str, endpoint: str, user_agent: str = None, 
-                      is_error: bool = False) -> float:
-        """Record request and return updated suspicion score."""
-        now = datetime.utcnow()
-        
+    def _update_pattern(self, client_ip: str, endpoint: str, user_agent: Optional[str],
+                        is_error: bool, now: datetime) -> RequestPattern:
+        """Fold one request into the client's pattern without rescoring it."""
         # Get or create pattern
         if client_ip not in self.client_patterns:
             self.client_patterns[client_ip] = RequestPattern(client_id=client_ip)
@@ -354,11 +352,40 @@ class AbuseDetector:
         else:
             pattern.error_rate = (pattern.error_rate * (pattern.request_count - 1)) / pattern.request_count
         
+        return pattern
+    
+    def record_request(self, client_ip: str, endpoint: str, user_agent: str = None, 
+                      is_error: bool = False) -> float:
+        """Record request and return updated suspicion score."""
+        pattern = self._update_pattern(client_ip, endpoint, user_agent, is_error, datetime.utcnow())
+        
         # Calculate and update suspicion score
         pattern.suspicious_score = self._calculate_suspicion_score(pattern)
         
         return pattern.suspicious_score
     
+    def record_requests(self, events: Iterable[Tuple[str, str, Optional[str], bool]]) -> Dict[str, float]:
+        """
+        Record a burst of requests and return the updated suspicion score per client.
+        
+        Each event is ``(client_ip, endpoint, user_agent, is_error)``. Patterns end up
+        exactly as if ``record_request`` had been called for each event in order, but
+        each client is scored once at the end instead of after every request.
+        """
+        update_pattern = self._update_pattern
+        utcnow = datetime.utcnow
+        touched: Dict[str, RequestPattern] = {}
+        
+        for client_ip, endpoint, user_agent, is_error in events:
+            touched[client_ip] = update_pattern(client_ip, endpoint, user_agent, is_error, utcnow())
+        
+        scores = {}
+        for client_ip, pattern in touched.items():
+            pattern.suspicious_score = self._calculate_suspicion_score(pattern)
+            scores[client_ip] = pattern.suspicious_score
+        
+        return scores
+    
     def is_suspicious(self, client_ip: str, threshold: float = 0.7) -> Tuple[bool, Dict]:
         """Check if client shows suspicious patterns."""
         pattern = self.client_patterns.get(client_ip)
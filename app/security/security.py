@@ -84,43 +84,49 @@ class SecurityViolation(BaseModel):
 class InputValidator:
     """Comprehensive input validation and sanitization."""
     
+    # Dangerous patterns (matching uses the compiled regexes below)
+    SQL_INJECTION_PATTERNS = (
+        r"(\b(union|select|insert|update|delete|drop|create|alter|exec|execute)\b)",
+        r"(--|#|\/\*|\*\/)",
+        r"(\b(or|and)\b\s+\d+\s*=\s*\d+)",
+        r"(\b(or|and)\b\s+['\"]\w+['\"]\s*=\s*['\"]\w+['\"]])",
+        r"(char|ascii|substring|length|mid|left|right)\s*\("
+    )
+    
+    XSS_PATTERNS = (
+        r"<script[^>]*>.*?</script>",
+        r"javascript:",
+        r"vbscript:",
+        r"on\w+\s*=",
+        r"<iframe[^>]*>.*?</iframe>",
+        r"<object[^>]*>.*?</object>",
+        r"<embed[^>]*>",
+        r"<link[^>]*>"
+    )
+    
+    COMMAND_INJECTION_PATTERNS = (
+        r"[;&|`$(){}[\]\\]",
+        r"\b(cat|ls|pwd|whoami|id|uname|ps|kill|rm|mv|cp|chmod|chown|sudo|su)\b",
+        r"(\.\./|\.\.\\)",
+        r"(/etc/passwd|/etc/shadow|/proc/)",
+        r"(cmd|powershell|bash|sh|zsh)\s"
+    )
+    
+    PATH_TRAVERSAL_PATTERNS = (
+        r"(\.\./|\.\.\\/)",
+        r"(%2e%2e%2f|%2e%2e\/|\.\.%2f|%2e%2e%5c)",
+        r"(\\\.\.\\|/\.\./)",
+        r"(%252e%252e%252f|%c0%af)"
+    )
+    
+    # Compiled once at import: every request body goes through _validate_string
+    _SQL_INJECTION_REGEXES = [re.compile(pattern, re.IGNORECASE) for pattern in SQL_INJECTION_PATTERNS]
+    _XSS_REGEXES = [re.compile(pattern, re.IGNORECASE) for pattern in XSS_PATTERNS]
+    _COMMAND_INJECTION_REGEXES = [re.compile(pattern, re.IGNORECASE) for pattern in COMMAND_INJECTION_PATTERNS]
+    _PATH_TRAVERSAL_REGEXES = [re.compile(pattern, re.IGNORECASE) for pattern in PATH_TRAVERSAL_PATTERNS]
+    
     def __init__(self, config: SecurityConfig):
         self.config = config
-        
-        # Dangerous patterns
-        self.sql_injection_patterns = [
-            r"(\b(union|select|insert|update|delete|drop|create|alter|exec|execute)\b)",
-            r"(--|#|\/\*|\*\/)",
-            r"(\b(or|and)\b\s+\d+\s*=\s*\d+)",
-            r"(\b(or|and)\b\s+['\"]\w+['\"]\s*=\s*['\"]\w+['\"]])",
-            r"(char|ascii|substring|length|mid|left|right)\s*\("
-        ]
-        
-        self.xss_patterns = [
-            r"<script[^>]*>.*?</script>",
-            r"javascript:",
-            r"vbscript:",
-            r"on\w+\s*=",
-            r"<iframe[^>]*>.*?</iframe>",
-            r"<object[^>]*>.*?</object>",
-            r"<embed[^>]*>",
-            r"<link[^>]*>"
-        ]
-        
-        self.command_injection_patterns = [
-            r"[;&|`$(){}[\]\\]",
-            r"\b(cat|ls|pwd|whoami|id|uname|ps|kill|rm|mv|cp|chmod|chown|sudo|su)\b",
-            r"(\.\./|\.\.\\)",
-            r"(/etc/passwd|/etc/shadow|/proc/)",
-            r"(cmd|powershell|bash|sh|zsh)\s"
-        ]
-        
-        self.path_traversal_patterns = [
-            r"(\.\./|\.\.\\/)",
-            r"(%2e%2e%2f|%2e%2e\/|\.\.%2f|%2e%2e%5c)",
-            r"(\\\.\.\\|/\.\./)",
-            r"(%252e%252e%252f|%c0%af)"
-        ]
     
     def validate_and_sanitize(self, data: Any, field_name: str = "input") -> Tuple[Any, List[str]]:
         """
@@ -151,34 +157,34 @@ class InputValidator:
             value = value[:self.config.max_input_length]
         
         # SQL injection check
-        for pattern in self.sql_injection_patterns:
-            if re.search(pattern, value, re.IGNORECASE):
+        for regex in self._SQL_INJECTION_REGEXES:
+            if regex.search(value):
                 violations.append(f"Potential SQL injection in {field_name}")
                 break
         
         # XSS check
-        for pattern in self.xss_patterns:
-            if re.search(pattern, value, re.IGNORECASE):
+        for regex in self._XSS_REGEXES:
+            if regex.search(value):
                 violations.append(f"Potential XSS in {field_name}")
                 # Sanitize XSS
-                value = re.sub(pattern, "", value, flags=re.IGNORECASE)
+                value = regex.sub("", value)
         
         # Command injection check
-        for pattern in self.command_injection_patterns:
-            if re.search(pattern, value, re.IGNORECASE):
+        for regex in self._COMMAND_INJECTION_REGEXES:
+            if regex.search(value):
                 violations.append(f"Potential command injection in {field_name}")
                 break
         
         # Path traversal check
-        for pattern in self.path_traversal_patterns:
-            if re.search(pattern, value, re.IGNORECASE):
+        for regex in self._PATH_TRAVERSAL_REGEXES:
+            if regex.search(value):
                 violations.append(f"Potential path traversal in {field_name}")
                 break
         
         # URL decode check (prevent double encoding attacks)
         decoded = unquote(value)
-        if decoded != value and any(re.search(p, decoded, re.IGNORECASE) for p in 
-                                   self.sql_injection_patterns + self.xss_patterns):
+        if decoded != value and any(regex.search(decoded) for regex in
+                                   self._SQL_INJECTION_REGEXES + self._XSS_REGEXES):
             violations.append(f"Potential encoding evasion in {field_name}")
         
         return value, violations
@@ -4,6 +4,7 @@ import asyncio
 import logging
 import time
 import uuid
+from collections import defaultdict
 from typing import Dict, Any, List, Optional, Tuple
 from urllib.parse import urlparse, urljoin
 
@@ -24,6 +25,31 @@ from app.utils.performance import get_performance_monitor
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# URL priority scoring keyword tables
+_HIGH_VALUE_DOMAINS = frozenset({
+    'linkedin.com', 'crunchbase.com', 'bloomberg.com',
+    'forbes.com', 'reuters.com', 'sec.gov'
+})
+_HIGH_VALUE_PATHS = (
+    'about', 'contact', 'company', 'team', 'leadership',
+    'investors', 'careers', 'press', 'news'
+)
+_CONTACT_TITLE_KEYWORDS = ('contact', 'address', 'phone', 'email', 'location')
+_FINANCIAL_TITLE_KEYWORDS = ('investor', 'funding', 'financial', 'revenue', 'valuation')
+_COMPANY_DESCRIPTION_KEYWORDS = (
+    'company', 'business', 'corporation', 'organization',
+    'startup', 'enterprise', 'firm'
+)
+_IRRELEVANT_DOMAINS = frozenset({
+    'wikipedia.org', 'facebook.com', 'instagram.com', 'twitter.com',
+    'youtube.com', 'pinterest.com', 'reddit.com'
+})
+
+
+def _registered_domain(host: str) -> str:
+    """Reduce a host to its last two labels (``uk.linkedin.com`` -> ``linkedin.com``)."""
+    return '.'.join(host.split(':', 1)[0].rsplit('.', 2)[-2:])
+
 
 class CompanyExtractionService:
     """
@@ -335,12 +361,14 @@ class CompanyExtractionService:
                     search_response = await self.serp_service.search(search_request)
                     
                     # Extract URLs and score them
-                    for result in search_response.organic_results[:5]:  # Top 5 results per query
-                        url = str(result.url)
-                        priority_score = self._score_url_priority(
-                            url, result.title, result.description or "", request
-                        )
-                        
+                    top_results = search_response.organic_results[:5]  # Top 5 results per query
+                    items = [
+                        (str(result.url), result.title, result.description or "")
+                        for result in top_results
+                    ]
+                    priority_scores = self._score_url_priorities(items, request)
+                    
+                    for (url, _, _), priority_score in zip(items, priority_scores):
                         # Keep highest score for each URL
                         if url not in url_candidates or priority_score > url_candidates[url]:
                             url_candidates[url] = priority_score
@@ -451,91 +479,93 @@ class CompanyExtractionService:
         Returns:
             Priority score (0.0 to 1.0)
         """
-        score = 0.0
+        return self._score_url_priorities([(url, title, description)], request)[0]
+    
+    def _score_url_priorities(
+        self,
+        items: List[Tuple[str, str, str]],
+        request: CompanyInformationRequest
+    ) -> List[float]:
+        """
+        Score a batch of URLs for crawling priority.
+        
+        Request-derived state (lowercased company name and domain, mode-specific
+        keywords) is computed once per batch rather than once per URL.
+        
+        Args:
+            items: List of (URL, title, description) tuples
+            request: Company information request
+            
+        Returns:
+            Priority scores (0.0 to 1.0), in the same order as ``items``
+        """
         company_name_lower = request.company_name.lower()
+        company_name_compact = company_name_lower.replace(' ', '')
+        request_domain_lower = request.domain.lower() if request.domain else None
         
-        # Parse URL components
-        try:
-            parsed_url = urlparse(url.lower())
-            domain = parsed_url.netloc.replace('www.', '')
-            path = parsed_url.path.lower()
-        except Exception:
-            return 0.0
-        
-        # Domain scoring
-        if request.domain and request.domain.lower() in domain:
-            score += 0.4  # Official domain gets highest priority
-        elif company_name_lower.replace(' ', '') in domain.replace('-', '').replace('_', ''):
-            score += 0.3  # Company name in domain
-        
-        # Known high-value domains
-        high_value_domains = [
-            'linkedin.com', 'crunchbase.com', 'bloomberg.com', 
-            'forbes.com', 'reuters.com', 'sec.gov'
-        ]
-        for hv_domain in high_value_domains:
-            if hv_domain in domain:
-                score += 0.2
-                break
-        
-        # Path-based scoring (official site pages)
-        high_value_paths = [
-            'about', 'contact', 'company', 'team', 'leadership',
-            'investors', 'careers', 'press', 'news'
-        ]
-        for hv_path in high_value_paths:
-            if hv_path in path:
-                score += 0.15
-                break
+        if request.extraction_mode == ExtractionMode.CONTACT_FOCUSED:
+            title_keywords = _CONTACT_TITLE_KEYWORDS
+        elif request.extraction_mode == ExtractionMode.FINANCIAL_FOCUSED:
+            title_keywords = _FINANCIAL_TITLE_KEYWORDS
+        else:
+            title_keywords = ()
         
-        # Title scoring
-        if title:
-            title_lower = title.lower()
-            if company_name_lower in title_lower:
+        scores = []
+        for url, title, description in items:
+            score = 0.0
+            
+            # Parse URL components
+            try:
+                parsed_url = urlparse(url.lower())
+                domain = parsed_url.netloc.replace('www.', '')
+                registered_domain = _registered_domain(domain)
+                path = parsed_url.path
+            except Exception:
+                scores.append(0.0)
+                continue
+            
+            # Domain scoring
+            if request_domain_lower and request_domain_lower in domain:
+                score += 0.4  # Official domain gets highest priority
+            elif company_name_compact in domain.replace('-', '').replace('_', ''):
+                score += 0.3  # Company name in domain
+            
+            # Known high-value domains
+            if registered_domain in _HIGH_VALUE_DOMAINS:
                 score += 0.2
             
-            # Mode-specific title scoring
-            if request.extraction_mode == ExtractionMode.CONTACT_FOCUSED:
-                contact_keywords = ['contact', 'address', 'phone', 'email', 'location']
-                for keyword in contact_keywords:
-                    if keyword in title_lower:
-                        score += 0.1
-                        break
-            
-            elif request.extraction_mode == ExtractionMode.FINANCIAL_FOCUSED:
-                financial_keywords = ['investor', 'funding', 'financial', 'revenue', 'valuation']
-                for keyword in financial_keywords:
-                    if keyword in title_lower:
-                        score += 0.1
-                        break
-        
-        # Description scoring
-        if description:
-            desc_lower = description.lower()
-            if company_name_lower in desc_lower:
-                score += 0.1
-            
-            # Look for company-related keywords in description
-            company_keywords = [
-                'company', 'business', 'corporation', 'organization',
-                'startup', 'enterprise', 'firm'
-            ]
-            for keyword in company_keywords:
-                if keyword in desc_lower:
+            # Path-based scoring (official site pages)
+            if any(hv_path in path for hv_path in _HIGH_VALUE_PATHS):
+                score += 0.15
+            
+            # Title scoring
+            if title:
+                title_lower = title.lower()
+                if company_name_lower in title_lower:
+                    score += 0.2
+                
+                # Mode-specific title scoring
+                if any(keyword in title_lower for keyword in title_keywords):
+                    score += 0.1
+            
+            # Description scoring
+            if description:
+                desc_lower = description.lower()
+                if company_name_lower in desc_lower:
+                    score += 0.1
+                
+                # Look for company-related keywords in description
+                if any(keyword in desc_lower for keyword in _COMPANY_DESCRIPTION_KEYWORDS):
                     score += 0.05
-                    break
-        
-        # Penalize irrelevant domains
-        irrelevant_domains = [
-            'wikipedia.org', 'facebook.com', 'instagram.com', 'twitter.com',
-            'youtube.com', 'pinterest.com', 'reddit.com'
-        ]
-        for irrelevant in irrelevant_domains:
-            if irrelevant in domain:
+            
+            # Penalize irrelevant domains
+            if registered_domain in _IRRELEVANT_DOMAINS:
                 score *= 0.7  # Reduce score but don't eliminate
+            
+            # Cap score at 1.0
+            scores.append(min(score, 1.0))
         
-        # Cap score at 1.0
-        return min(score, 1.0)
+        return scores
     
     async def _crawl_company_pages(
         self,
@@ -560,17 +590,20 @@ class CompanyExtractionService:
         
         # Rate limiting configuration
         base_delay = 1.0  # Base delay between requests
-        max_concurrent = 3  # Maximum concurrent crawl requests
+        max_concurrent = 5  # Maximum concurrent crawl requests
+        max_concurrent_per_host = 2  # Maximum concurrent crawl requests per host
         
-        # Create semaphore for concurrent control
+        # Create semaphores for global and per-host concurrent control
         semaphore = asyncio.Semaphore(max_concurrent)
+        host_semaphores = defaultdict(lambda: asyncio.Semaphore(max_concurrent_per_host))
         
         async def crawl_single_url(url_info: Tuple[str, float]) -> Optional[Tuple[str, str, Dict]]:
             """Crawl a single URL with error handling."""
             nonlocal pages_attempted, pages_crawled
             url, priority_score = url_info
             
-            async with semaphore:  # Limit concurrent requests
+            # Take the host slot first so a busy host never holds global slots while waiting
+            async with host_semaphores[urlparse(url).netloc.lower()], semaphore:
                 try:
                     pages_attempted += 1
                     logger.debug(f"Crawling URL: {url} (priority: {priority_score:.2f})")
@@ -13,7 +13,7 @@ from app.utils.exceptions import generate_trace_id
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class OperationMetrics:
     """Metrics for tracking operation performance."""
     operation_name: str
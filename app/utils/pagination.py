@@ -6,7 +6,6 @@ in search results, calculating metadata, and validating pagination parameters.
 """
 
 import logging
-import math
 import re
 from typing import Optional, Tuple, Dict, Any
 from app.models.serp import PaginationMetadata
@@ -31,6 +30,9 @@ class PaginationHelper:
         r'Page\s+\d+\s+of\s+about\s+([\d,]+)',      # "Page 1 of about 1,234,567"
     ]
     
+    # Compiled once at import so extraction never goes through re's compile cache
+    _COMPILED_RESULTS_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in GOOGLE_RESULTS_PATTERNS]
+    
     @staticmethod
     def calculate_start_index(page: int, results_per_page: int) -> int:
         """
@@ -68,7 +70,53 @@ class PaginationHelper:
         if results_per_page < 1:
             raise ValueError("Results per page must be >= 1")
             
-        return math.ceil(total_results / results_per_page)
+        # Integer ceiling division: no float round-trip, exact for any size
+        return -(-total_results // results_per_page)
+    
+    @staticmethod
+    def calculate_start_index_batch(pages, results_per_page):
+        """
+        Vectorized ``calculate_start_index`` for bulk sweeps.
+        
+        Args:
+            pages: Array-like of page numbers (1-based)
+            results_per_page: Scalar or array-like of results per page
+            
+        Returns:
+            NumPy array of starting indices
+        """
+        import numpy as np
+        
+        pages = np.asarray(pages, dtype=np.int64)
+        results_per_page = np.broadcast_to(np.asarray(results_per_page, dtype=np.int64), pages.shape)
+        if (pages < 1).any():
+            raise ValueError("Page number must be >= 1")
+        if (results_per_page < 1).any():
+            raise ValueError("Results per page must be >= 1")
+        
+        starts = np.empty_like(pages)
+        return np.multiply(pages - 1, results_per_page, out=starts)
+    
+    @staticmethod
+    def calculate_total_pages_batch(total_results, results_per_page):
+        """
+        Vectorized ``calculate_total_pages`` for known result totals.
+        
+        Args:
+            total_results: Array-like of total result counts
+            results_per_page: Scalar or array-like of results per page
+            
+        Returns:
+            NumPy array of total pages (ceiling division)
+        """
+        import numpy as np
+        
+        total_results = np.asarray(total_results, dtype=np.int64)
+        results_per_page = np.asarray(results_per_page, dtype=np.int64)
+        if (results_per_page < 1).any():
+            raise ValueError("Results per page must be >= 1")
+        
+        return (total_results + results_per_page - 1) // results_per_page
     
     @staticmethod
     def calculate_page_range(page: int, results_per_page: int, actual_results_count: int) -> Tuple[int, int]:
@@ -115,9 +163,10 @@ class PaginationHelper:
             return None
             
         # Try each pattern
-        for pattern in PaginationHelper.GOOGLE_RESULTS_PATTERNS:
+        for compiled in PaginationHelper._COMPILED_RESULTS_PATTERNS:
+            pattern = compiled.pattern
             try:
-                match = re.search(pattern, text, re.IGNORECASE)
+                match = compiled.search(text)
                 if match:
                     # Extract number and remove commas
                     number_str = match.group(1).replace(',', '').replace(' ', '')
@@ -164,38 +213,29 @@ class PaginationHelper:
             raise ValueError("Results per page must be >= 1")
         if actual_results_count < 0:
             raise ValueError("Actual results count must be >= 0")
+        # The model is built without validation below, so enforce its
+        # page_range_start/page_range_end >= 1 constraint here
+        if actual_results_count == 0:
+            raise ValueError("Cannot generate pagination metadata for a page with no results")
             
-        # Calculate total pages estimate
-        total_pages_estimate = None
-        if total_results_estimate is not None:
-            total_pages_estimate = PaginationHelper.calculate_total_pages(
-                total_results_estimate, results_per_page
-            )
-            # Apply reasonable limit (Google typically shows max 1000 pages)
-            if total_pages_estimate and total_pages_estimate > max_page_limit:
-                total_pages_estimate = max_page_limit
+        page_start = (current_page - 1) * results_per_page + 1
+        page_end = page_start + actual_results_count - 1
         
-        # Calculate page range
-        page_start, page_end = PaginationHelper.calculate_page_range(
-            current_page, results_per_page, actual_results_count
-        )
+        # With a total estimate, compare against the (capped) page count;
+        # without one, a short page means there is nothing after it.
+        # Google typically shows max 1000 pages, hence max_page_limit.
+        if total_results_estimate is None:
+            total_pages_estimate = None
+            has_next_page = actual_results_count >= results_per_page
+        else:
+            total_pages_estimate = min(-(-total_results_estimate // results_per_page), max_page_limit)
+            has_next_page = current_page < total_pages_estimate
         
-        # Determine navigation availability
         has_previous_page = current_page > 1
-        has_next_page = True  # Default assumption
-        
-        # Refine has_next_page based on available information
-        if total_pages_estimate is not None:
-            has_next_page = current_page < total_pages_estimate
-        elif actual_results_count < results_per_page:
-            # If we got fewer results than requested, likely no more pages
-            has_next_page = False
-            
-        # Apply max page limit
-        if current_page >= max_page_limit:
-            has_next_page = False
+        has_next_page = has_next_page and current_page < max_page_limit
         
-        return PaginationMetadata(
+        # Every field is derived from the checks above: skip re-validation
+        return PaginationMetadata.model_construct(
             current_page=current_page,
             results_per_page=results_per_page,
             total_results_estimate=total_results_estimate,
@@ -32,7 +32,7 @@ class BottleneckType(str, Enum):
     RESOURCE_CONTENTION = "resource_contention"   # Resource conflicts
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceMetric:
     """Individual performance metric measurement."""
     name: str
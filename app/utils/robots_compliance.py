@@ -6,12 +6,12 @@ respectful crawling practices to maintain ethical web scraping standards.
 """
 
 import asyncio
+import functools
 import logging
 import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Set, Tuple
 from urllib.parse import urljoin, urlparse
-from urllib.robotparser import RobotFileParser
 
 import aiohttp
 from pydantic import BaseModel, Field
@@ -50,6 +50,62 @@ class RobotsCache(BaseModel):
     expires_at: datetime = Field(description="Cache expiration time")
 
 
+@functools.lru_cache(maxsize=512)
+def _parse_robots_content(
+    content: str, min_crawl_delay: float
+) -> Tuple[Tuple[RobotsDirective, ...], Tuple[str, ...], float]:
+    """
+    Parse robots.txt content into directives, sitemap URLs and the crawl delay.
+    
+    Parsing depends only on the content, so refreshes that fetch an unchanged
+    robots.txt hit the cache. Directives are never mutated and are shared between
+    calls; sitemaps are returned as URLs because SitemapInfo carries per-use state.
+    """
+    directives = []
+    global_crawl_delay = min_crawl_delay
+    
+    # Parse sitemaps
+    sitemap_urls = tuple(
+        line.strip().split(':', 1)[1].strip() for line in content.split('\n')
+        if line.strip().lower().startswith('sitemap:')
+    )
+    
+    # Parse crawl delays and other directives
+    lines = content.split('\n')
+    current_user_agent = '*'
+    
+    for line in lines:
+        line = line.strip().lower()
+        
+        if line.startswith('user-agent:'):
+            current_user_agent = line.split(':', 1)[1].strip()
+        
+        elif line.startswith('crawl-delay:'):
+            try:
+                delay = float(line.split(':', 1)[1].strip())
+                global_crawl_delay = max(global_crawl_delay, delay)
+            except ValueError:
+                pass
+        
+        elif line.startswith('allow:'):
+            path = line.split(':', 1)[1].strip()
+            directives.append(RobotsDirective(
+                user_agent=current_user_agent,
+                allowed=True,
+                path=path
+            ))
+        
+        elif line.startswith('disallow:'):
+            path = line.split(':', 1)[1].strip()
+            directives.append(RobotsDirective(
+                user_agent=current_user_agent,
+                allowed=False,
+                path=path
+            ))
+    
+    return tuple(directives), sitemap_urls, global_crawl_delay
+
+
 class CrawlTracker:
     """Track crawling activity for rate limiting compliance."""
     
@@ -116,24 +172,58 @@ class RobotsComplianceManager:
         self.robots_cache: Dict[str, RobotsCache] = {}
         self.crawl_tracker = CrawlTracker()
         self.session: Optional[aiohttp.ClientSession] = None
+        self._session_users = 0  # Open ``async with`` blocks sharing self.session
+        self._robots_inflight: Dict[str, asyncio.Task] = {}  # Domain -> pending robots.txt load
         self.cache_duration = timedelta(hours=24)  # Cache robots.txt for 24 hours
         self.min_crawl_delay = 1.0  # Minimum delay between requests (seconds)
         self.max_requests_per_hour = 100  # Maximum requests per domain per hour
+        self.max_robots_bytes = 500 * 1024  # Parse limit for robots.txt (RFC 9309)
         self.respect_crawl_delay = True
         self.default_user_agent = "Crawl4AI-GoogleSERP/1.0 (respectful crawler)"
     
     async def __aenter__(self):
-        """Async context manager entry."""
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=10),
-            headers={"User-Agent": self.default_user_agent}
-        )
+        """
+        Async context manager entry.
+        
+        Overlapping entries (e.g. concurrent crawls through the global
+        ``robots_manager``) share one pooled session instead of each opening
+        its own and closing it underneath the others.
+        """
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=10,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=30
+                ),
+                timeout=aiohttp.ClientTimeout(total=10),
+                headers={"User-Agent": self.default_user_agent}
+            )
+        self._session_users += 1
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
-        if self.session:
+        """Async context manager exit; closes the session once the last user leaves."""
+        self._session_users = max(self._session_users - 1, 0)
+        if self._session_users == 0 and self.session:
             await self.session.close()
+            self.session = None
+    
+    async def initialize(self):
+        """
+        Hold the shared session open for the application lifetime.
+        
+        Crawls still enter and exit the manager as usual, but the session (and
+        its pooled connections and DNS cache) is no longer torn down between
+        bursts of requests.
+        """
+        await self.__aenter__()
+        logger.info("Initialized shared robots.txt HTTP session")
+    
+    async def shutdown(self):
+        """Release the application-lifetime hold on the shared session."""
+        await self.__aexit__(None, None, None)
     
     def _get_domain(self, url: str) -> str:
         """Extract domain from URL."""
@@ -155,7 +245,12 @@ class RobotsComplianceManager:
             
             async with self.session.get(robots_url) as response:
                 if response.status == 200:
-                    content = await response.text()
+                    # Stop reading at the parse limit instead of downloading oversized files
+                    try:
+                        raw = await response.content.readexactly(self.max_robots_bytes)
+                    except asyncio.IncompleteReadError as e:
+                        raw = e.partial  # File is smaller than the limit
+                    content = raw.decode(response.charset or 'utf-8', errors='replace')
                     logger.info(f"Successfully fetched robots.txt from {domain}")
                     return content
                 elif response.status == 404:
@@ -170,57 +265,9 @@ class RobotsComplianceManager:
             return None
     
     def _parse_robots_txt(self, domain: str, content: str) -> Tuple[List[RobotsDirective], List[SitemapInfo], float]:
-        """Parse robots.txt content."""
-        directives = []
-        sitemaps = []
-        global_crawl_delay = self.min_crawl_delay
-        
-        # Use stdlib robotparser for basic parsing
-        rp = RobotFileParser()
-        rp.read_data(content)
-        
-        # Parse sitemaps
-        sitemap_lines = [line.strip() for line in content.split('\n') 
-                        if line.strip().lower().startswith('sitemap:')]
-        
-        for line in sitemap_lines:
-            sitemap_url = line.split(':', 1)[1].strip()
-            sitemaps.append(SitemapInfo(url=sitemap_url))
-        
-        # Parse crawl delays and other directives
-        lines = content.split('\n')
-        current_user_agent = '*'
-        
-        for line in lines:
-            line = line.strip().lower()
-            
-            if line.startswith('user-agent:'):
-                current_user_agent = line.split(':', 1)[1].strip()
-            
-            elif line.startswith('crawl-delay:'):
-                try:
-                    delay = float(line.split(':', 1)[1].strip())
-                    global_crawl_delay = max(global_crawl_delay, delay)
-                except ValueError:
-                    pass
-            
-            elif line.startswith('allow:'):
-                path = line.split(':', 1)[1].strip()
-                directives.append(RobotsDirective(
-                    user_agent=current_user_agent,
-                    allowed=True,
-                    path=path
-                ))
-            
-            elif line.startswith('disallow:'):
-                path = line.split(':', 1)[1].strip()
-                directives.append(RobotsDirective(
-                    user_agent=current_user_agent,
-                    allowed=False,
-                    path=path
-                ))
-        
-        return directives, sitemaps, global_crawl_delay
+        """Parse robots.txt content; identical content is only parsed once."""
+        directives, sitemap_urls, crawl_delay = _parse_robots_content(content, self.min_crawl_delay)
+        return list(directives), [SitemapInfo(url=url) for url in sitemap_urls], crawl_delay
     
     async def _get_robots_info(self, url: str) -> Optional[RobotsCache]:
         """Get robots.txt information for URL, using cache if available."""
@@ -231,6 +278,18 @@ class RobotsComplianceManager:
         if cached and datetime.utcnow() < cached.expires_at:
             return cached
         
+        # Share a pending fetch for the same domain instead of issuing another request
+        task = self._robots_inflight.get(domain)
+        if task is None:
+            task = asyncio.ensure_future(self._load_robots_info(domain))
+            self._robots_inflight[domain] = task
+            task.add_done_callback(lambda _: self._robots_inflight.pop(domain, None))
+        
+        # Shield so one cancelled caller does not abort the fetch for the others
+        return await asyncio.shield(task)
+    
+    async def _load_robots_info(self, domain: str) -> Optional[RobotsCache]:
+        """Fetch, parse and cache robots.txt for domain."""
         # Fetch fresh robots.txt
         content = await self._fetch_robots_txt(domain)
         if content is None:
@@ -379,8 +438,14 @@ class RobotsComplianceManager:
             "expired_cache_entries": expired_domains,
             "blocked_domains": len(self.crawl_tracker.blocked_domains),
             "tracked_domains": len(self.crawl_tracker.last_crawl_times),
-            "cache_hit_rate": (total_domains - expired_domains) / max(total_domains, 1)
+            "cache_hit_rate": (total_domains - expired_domains) / max(total_domains, 1),
+            "parse_cache": self.parse_cache_info()
         }
+    
+    @staticmethod
+    def parse_cache_info() -> Dict:
+        """Hit/miss counters for the shared robots.txt parse cache."""
+        return _parse_robots_content.cache_info()._asdict()
 
 
 # Global instance
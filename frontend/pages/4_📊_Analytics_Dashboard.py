@@ -13,7 +13,7 @@ st.set_page_config(
 )
 
 # Import shared utilities
-from utils.streamlit_shared import make_api_request, init_session_state, render_sidebar_config
+from utils.streamlit_shared import check_api_health, init_session_state, render_sidebar_config
 
 # Initialize session state
 init_session_state()
@@ -74,7 +74,7 @@ else:
 
 # API Health Status
 st.subheader("API Health Status")
-test_result = make_api_request("/api/v1/health")
+test_result = check_api_health()
 
 if test_result["success"]:
     health_data = test_result["data"]
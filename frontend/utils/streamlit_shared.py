@@ -3,12 +3,23 @@ Shared utilities for Streamlit multipage application.
 Contains common functions used across multiple pages.
 """
 
+import time
+import orjson
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any
 
 # Configuration
 API_BASE_URL = "http://localhost:8000"
+HEALTH_CHECK_TTL = 10  # seconds a health check result is reused across reruns
+
+# One pooled session per Streamlit process: module globals survive reruns,
+# so repeated API calls reuse keep-alive connections instead of reconnecting
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0))
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
 
 def init_session_state():
@@ -16,6 +27,7 @@ def init_session_state():
     defaults = {
         'api_url': API_BASE_URL,
         'connection_status': None,
+        'connection_checked_at': None,
         'search_results': None,
         'instagram_results': None,
         'company_results': None
@@ -32,12 +44,13 @@ def make_api_request(endpoint: str, method: str = "GET", data: Dict = None, time
     
     try:
         if method == "POST":
-            response = requests.post(url, json=data, timeout=timeout)
+            body = orjson.dumps(data) if data is not None else None
+            response = _SESSION.post(url, data=body, headers=_JSON_HEADERS, timeout=timeout)
         else:
-            response = requests.get(url, timeout=timeout)
+            response = _SESSION.get(url, timeout=timeout)
             
         response.raise_for_status()
-        return {"success": True, "data": response.json()}
+        return {"success": True, "data": orjson.loads(response.content)}
         
     except requests.exceptions.Timeout:
         return {"success": False, "error": "Request timed out"}
@@ -45,7 +58,7 @@ def make_api_request(endpoint: str, method: str = "GET", data: Dict = None, time
         return {"success": False, "error": "Could not connect to API"}
     except requests.exceptions.HTTPError as e:
         try:
-            error_detail = response.json()
+            error_detail = orjson.loads(response.content)
             return {"success": False, "error": f"HTTP {response.status_code}: {error_detail.get('message', str(e))}"}
         except:
             return {"success": False, "error": f"HTTP {response.status_code}: {str(e)}"}
@@ -53,6 +66,23 @@ def make_api_request(endpoint: str, method: str = "GET", data: Dict = None, time
         return {"success": False, "error": f"Unexpected error: {str(e)}"}
 
 
+def check_api_health(force: bool = False) -> Dict[str, Any]:
+    """
+    Check API health, reusing a successful result under HEALTH_CHECK_TTL seconds old.
+    
+    Failures are never reused, so a check right after the API comes up sees it;
+    ``force`` skips the cache entirely (explicit user-triggered checks).
+    """
+    checked_at = st.session_state.connection_checked_at
+    if not force and checked_at is not None and time.monotonic() - checked_at < HEALTH_CHECK_TTL:
+        return st.session_state.connection_status
+    
+    result = make_api_request("/api/v1/health")
+    st.session_state.connection_status = result
+    st.session_state.connection_checked_at = time.monotonic() if result["success"] else None
+    return result
+
+
 def render_sidebar_config():
     """Render sidebar configuration section."""
     # Home Navigation
@@ -69,12 +99,12 @@ def render_sidebar_config():
     if new_api_url != st.session_state.api_url:
         st.session_state.api_url = new_api_url
         st.session_state.connection_status = None
+        st.session_state.connection_checked_at = None
         st.rerun()
     
     # Connection Test
     if st.sidebar.button("Test Connection"):
-        result = make_api_request("/api/v1/health")
-        st.session_state.connection_status = result
+        check_api_health(force=True)
         st.rerun()
     
     # Display connection status
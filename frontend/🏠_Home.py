@@ -14,7 +14,7 @@ st.set_page_config(
 )
 
 # Import shared utilities
-from utils.streamlit_shared import make_api_request, init_session_state, render_sidebar_config
+from utils.streamlit_shared import check_api_health, init_session_state, render_sidebar_config
 
 # Initialize session state
 init_session_state()
@@ -125,8 +125,7 @@ st.subheader("🔧 System Status")
 # Test API connection automatically on page load
 if not st.session_state.get('connection_status'):
     with st.spinner("Checking API connection..."):
-        result = make_api_request("/api/v1/health")
-        st.session_state.connection_status = result
+        check_api_health()
 
 if st.session_state.connection_status:
     if st.session_state.connection_status["success"]:
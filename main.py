@@ -17,6 +17,7 @@ from app.security.rate_limiting import rate_limiter, rate_limit_middleware
 from app.security.security import security_manager, security_validation_middleware
 from app.compliance.monitoring import compliance_manager, compliance_middleware
 from app.monitoring.production import production_monitor, monitoring_middleware
+from app.utils.robots_compliance import robots_manager
 from app.clients.bright_data import (
     BrightDataError, 
     BrightDataRateLimitError, 
@@ -61,6 +62,7 @@ async def lifespan(app: FastAPI):
     await rate_limiter.initialize()
     await compliance_manager.initialize_redis()
     await production_monitor.initialize()
+    await robots_manager.initialize()
     
     logger.info("✅ All security systems initialized successfully")
     logger.info("🛡️  Enterprise-grade security features active")
@@ -73,6 +75,7 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down security and monitoring systems...")
     await rate_limiter.shutdown()
     await production_monitor.shutdown()
+    await robots_manager.shutdown()
     logger.info("Shutting down Google SERP + Crawl4ai API")
 
 
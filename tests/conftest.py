@@ -1,10 +1,17 @@
 """Shared test configuration and fixtures for company extraction tests."""
 
 import pytest
+import pytest_asyncio
 import asyncio
 from pathlib import Path
 from typing import Dict, Any, Optional
 from unittest.mock import AsyncMock, MagicMock
+from httpx import ASGITransport, AsyncClient
+
+try:
+    import uvloop
+except ImportError:  # uvloop is unavailable on Windows
+    uvloop = None
 
 # Import resilience utilities first to ensure decorators are available
 from app.utils.resilience import resilient_operation
@@ -61,12 +68,35 @@ async def mock_company_service():
     return service
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def company_parser():
-    """Create a company information parser instance."""
+    """Company information parser shared across the session (it holds no per-call state)."""
     return CompanyInformationParser()
 
 
+@pytest.fixture(scope="session")
+def app():
+    """The FastAPI application ``main`` builds at import, shared by in-process API tests.
+    
+    Imported lazily so modules that never touch the API don't pay for loading
+    ``main``. Tests needing isolation should use ``app.dependency_overrides``
+    and clear it in teardown rather than building another app.
+    """
+    from main import app
+    return app
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client(app):
+    """Async client over the session-wide app; tests using it run on the session loop.
+    
+    Modules that need a sync ``TestClient`` or a fresh app define their own
+    ``client`` fixture, which takes precedence over this one.
+    """
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as async_client:
+        yield async_client
+
+
 @pytest.fixture
 def mock_successful_search_response():
     """Mock successful SERP search response."""
@@ -425,11 +455,11 @@ def validation_test_cases():
 
 # Async test utilities
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def event_loop_policy():
+    """Run async tests on uvloop when it is installed."""
+    if uvloop is not None:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
 
 
 # Test database setup (if needed for future tests)
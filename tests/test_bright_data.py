@@ -1,7 +1,8 @@
 """Unit tests for Bright Data SERP API client."""
 
 import pytest
-from unittest.mock import AsyncMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 import httpx
 
 from app.clients.bright_data import (
@@ -13,6 +14,15 @@ from app.clients.bright_data import (
 from app.models.serp import SearchRequest, SearchResponse, SearchResult
 
 
+def _fake_post(status_code=200, text="", exc=None):
+    """Lightweight stand-in for httpx.AsyncClient.post returning a fixed response (or raising exc)."""
+    async def post(*args, **kwargs):
+        if exc is not None:
+            raise exc
+        return SimpleNamespace(status_code=status_code, text=text)
+    return post
+
+
 class TestBrightDataClient:
     """Test cases for BrightDataClient."""
 
@@ -86,14 +96,7 @@ class TestBrightDataClient:
     @pytest.mark.asyncio
     async def test_search_success(self, client, search_request, mock_html_response):
         """Test successful search request."""
-        # Mock the HTTP response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = mock_html_response
-        
-        with patch.object(client.client, 'post', new_callable=AsyncMock) as mock_post:
-            mock_post.return_value = mock_response
-            
+        with patch.object(client.client, 'post', _fake_post(200, mock_html_response)):
             # Mock the parser to return mock results
             with patch.object(client.parser, 'parse_html') as mock_parse:
                 mock_search_response = SearchResponse(
@@ -121,48 +124,28 @@ class TestBrightDataClient:
     @pytest.mark.asyncio
     async def test_search_authentication_error(self, client, search_request):
         """Test search with authentication error."""
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_response.text = "Unauthorized"
-        
-        with patch.object(client.client, 'post', new_callable=AsyncMock) as mock_post:
-            mock_post.return_value = mock_response
-            
+        with patch.object(client.client, 'post', _fake_post(401, "Unauthorized")):
             with pytest.raises(BrightDataError, match="Authentication failed"):
                 await client.search(search_request)
 
     @pytest.mark.asyncio
     async def test_search_rate_limit_error(self, client, search_request):
         """Test search with rate limit error."""
-        mock_response = Mock()
-        mock_response.status_code = 429
-        mock_response.text = "Rate limit exceeded"
-        
-        with patch.object(client.client, 'post', new_callable=AsyncMock) as mock_post:
-            mock_post.return_value = mock_response
-            
+        with patch.object(client.client, 'post', _fake_post(429, "Rate limit exceeded")):
             with pytest.raises(BrightDataRateLimitError, match="Rate limit exceeded"):
                 await client.search(search_request)
 
     @pytest.mark.asyncio
     async def test_search_bad_request_error(self, client, search_request):
         """Test search with bad request error."""
-        mock_response = Mock()
-        mock_response.status_code = 400
-        mock_response.text = "Bad request parameters"
-        
-        with patch.object(client.client, 'post', new_callable=AsyncMock) as mock_post:
-            mock_post.return_value = mock_response
-            
+        with patch.object(client.client, 'post', _fake_post(400, "Bad request parameters")):
             with pytest.raises(BrightDataError, match="Bad request"):
                 await client.search(search_request)
 
     @pytest.mark.asyncio
     async def test_search_timeout_error(self, client, search_request):
         """Test search with timeout error."""
-        with patch.object(client.client, 'post', new_callable=AsyncMock) as mock_post:
-            mock_post.side_effect = httpx.TimeoutException("Request timeout")
-            
+        with patch.object(client.client, 'post', _fake_post(exc=httpx.TimeoutException("Request timeout"))):
             with pytest.raises(BrightDataTimeoutError, match="Request timeout"):
                 await client.search(search_request)
 
@@ -173,7 +156,7 @@ class TestBrightDataClient:
         mock_responses = [
             httpx.TimeoutException("Timeout"),
             httpx.RequestError("Connection error"),
-            Mock(status_code=200, text=mock_html_response)
+            SimpleNamespace(status_code=200, text=mock_html_response)
         ]
         
         call_count = 0
@@ -201,9 +184,7 @@ class TestBrightDataClient:
     @pytest.mark.asyncio
     async def test_search_max_retries_exceeded(self, client, search_request):
         """Test behavior when max retries are exceeded."""
-        with patch.object(client.client, 'post', new_callable=AsyncMock) as mock_post:
-            mock_post.side_effect = httpx.TimeoutException("Persistent timeout")
-            
+        with patch.object(client.client, 'post', _fake_post(exc=httpx.TimeoutException("Persistent timeout"))):
             with patch('asyncio.sleep', new_callable=AsyncMock):  # Speed up tests
                 with pytest.raises(BrightDataTimeoutError):
                     await client.search(search_request)
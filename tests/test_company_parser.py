@@ -2,9 +2,11 @@
 
 import pytest
 import json
+import time
 from unittest.mock import patch, MagicMock
 from bs4 import BeautifulSoup
 
+from app.parsers import company_parser
 from app.parsers.company_parser import CompanyInformationParser, create_company_parser
 from app.models.company import (
     CompanyInformation, CompanyBasicInfo, CompanyContact, CompanySocial,
@@ -16,9 +18,9 @@ from app.models.company import (
 class TestCompanyInformationParser:
     """Test suite for CompanyInformationParser."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def parser(self):
-        """Create parser instance for testing."""
+        """Parser instance shared by the class (it holds no per-call state)."""
         return CompanyInformationParser()
     
     @pytest.fixture
@@ -483,6 +485,20 @@ class TestCompanyInformationParser:
         assert components['state'] == "CA"
         assert components['postal_code'] == "94105"
     
+    def test_address_and_email_patterns_stay_linear_on_pathological_text(self, monkeypatch):
+        """Test that long non-matching text does not trigger quadratic backtracking."""
+        # Force the stdlib engine: RE2 is linear regardless of the patterns' quantifiers
+        monkeypatch.setattr(company_parser, "re2", None)
+        parser = CompanyInformationParser()
+    
+        start = time.perf_counter()
+        parser._extract_address_components("1 a " * 8000)
+        parser._extract_address_components("1 x, " * 8000)
+        parser._extract_emails("a." * 8000)
+    
+        # Unbounded patterns took tens of seconds on these inputs
+        assert time.perf_counter() - start < 5.0
+    
     def test_extract_social_media_comprehensive(self, parser, sample_html_social_media):
         """Test comprehensive social media extraction."""
         soup = BeautifulSoup(sample_html_social_media, 'html.parser')
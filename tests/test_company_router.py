@@ -3,10 +3,8 @@
 import pytest
 import json
 from unittest.mock import AsyncMock, patch, MagicMock
-from fastapi.testclient import TestClient
 from datetime import datetime, UTC
 
-from main import create_app
 from app.models.company import (
     CompanyInformationRequest, CompanyExtractionResponse, CompanyInformation,
     CompanyBasicInfo, CompanyContact, CompanySocial, ExtractionMetadata,
@@ -15,13 +13,6 @@ from app.models.company import (
 from app.utils.exceptions import CompanyAnalysisError
 
 
-@pytest.fixture
-def client():
-    """Create test client."""
-    app = create_app()
-    return TestClient(app)
-
-
 @pytest.fixture
 def sample_company_request():
     """Sample company information request."""
@@ -90,12 +81,13 @@ def sample_extraction_response():
     )
 
 
+@pytest.mark.asyncio(loop_scope="session")
 class TestCompanyExtractionEndpoint:
     """Test cases for the /api/v1/company/extract endpoint."""
     
-    def test_extract_endpoint_exists(self, client):
+    async def test_extract_endpoint_exists(self, client):
         """Test that the extract endpoint is accessible."""
-        response = client.post("/api/v1/company/extract", json={})
+        response = await client.post("/api/v1/company/extract", json={})
         # Should fail validation, not return 404
         assert response.status_code in [400, 422]
     
@@ -115,7 +107,7 @@ class TestCompanyExtractionEndpoint:
             mock_service.__aexit__ = AsyncMock()
             mock_service_class.return_value = mock_service
             
-            response = client.post("/api/v1/company/extract", json=sample_company_request)
+            response = await client.post("/api/v1/company/extract", json=sample_company_request)
         
         # Assertions
         assert response.status_code == 200
@@ -143,113 +135,113 @@ class TestCompanyExtractionEndpoint:
         assert data["company_information"]["data_quality_score"] == 0.80
         assert data["company_information"]["completeness_score"] == 0.75
     
-    def test_extract_validation_error_empty_company_name(self, client):
+    async def test_extract_validation_error_empty_company_name(self, client):
         """Test validation error for empty company name."""
         request_data = {
             "company_name": "",
             "extraction_mode": "basic"
         }
         
-        response = client.post("/api/v1/company/extract", json=request_data)
+        response = await client.post("/api/v1/company/extract", json=request_data)
         
         assert response.status_code == 422
         data = response.json()
         assert "validation_error" in data["type"]
         assert any("min_length" in str(detail) for detail in data["details"])
     
-    def test_extract_validation_error_invalid_extraction_mode(self, client):
+    async def test_extract_validation_error_invalid_extraction_mode(self, client):
         """Test validation error for invalid extraction mode."""
         request_data = {
             "company_name": "TestCorp",
             "extraction_mode": "invalid_mode"
         }
         
-        response = client.post("/api/v1/company/extract", json=request_data)
+        response = await client.post("/api/v1/company/extract", json=request_data)
         
         assert response.status_code == 422
         data = response.json()
         assert "validation_error" in data["type"]
     
-    def test_extract_validation_error_invalid_country_code(self, client):
+    async def test_extract_validation_error_invalid_country_code(self, client):
         """Test validation error for invalid country code."""
         request_data = {
             "company_name": "TestCorp",
             "country": "usa"  # Should be 2-letter uppercase
         }
         
-        response = client.post("/api/v1/company/extract", json=request_data)
+        response = await client.post("/api/v1/company/extract", json=request_data)
         
         assert response.status_code == 422
         data = response.json()
         assert "validation_error" in data["type"]
     
-    def test_extract_validation_error_invalid_language_code(self, client):
+    async def test_extract_validation_error_invalid_language_code(self, client):
         """Test validation error for invalid language code."""
         request_data = {
             "company_name": "TestCorp",
             "language": "EN"  # Should be 2-letter lowercase
         }
         
-        response = client.post("/api/v1/company/extract", json=request_data)
+        response = await client.post("/api/v1/company/extract", json=request_data)
         
         assert response.status_code == 422
         data = response.json()
         assert "validation_error" in data["type"]
     
-    def test_extract_validation_error_invalid_pages_to_crawl(self, client):
+    async def test_extract_validation_error_invalid_pages_to_crawl(self, client):
         """Test validation error for invalid max_pages_to_crawl."""
         request_data = {
             "company_name": "TestCorp",
             "max_pages_to_crawl": 0  # Should be >= 1
         }
         
-        response = client.post("/api/v1/company/extract", json=request_data)
+        response = await client.post("/api/v1/company/extract", json=request_data)
         
         assert response.status_code == 422
         data = response.json()
         assert "validation_error" in data["type"]
         
         request_data["max_pages_to_crawl"] = 25  # Should be <= 20
-        response = client.post("/api/v1/company/extract", json=request_data)
+        response = await client.post("/api/v1/company/extract", json=request_data)
         
         assert response.status_code == 422
         data = response.json()
         assert "validation_error" in data["type"]
     
-    def test_extract_validation_error_invalid_timeout(self, client):
+    async def test_extract_validation_error_invalid_timeout(self, client):
         """Test validation error for invalid timeout."""
         request_data = {
             "company_name": "TestCorp",
             "timeout_seconds": 4  # Should be >= 5
         }
         
-        response = client.post("/api/v1/company/extract", json=request_data)
+        response = await client.post("/api/v1/company/extract", json=request_data)
         
         assert response.status_code == 422
         data = response.json()
         assert "validation_error" in data["type"]
         
         request_data["timeout_seconds"] = 125  # Should be <= 120
-        response = client.post("/api/v1/company/extract", json=request_data)
+        response = await client.post("/api/v1/company/extract", json=request_data)
         
         assert response.status_code == 422
         data = response.json()
         assert "validation_error" in data["type"]
     
-    def test_extract_validation_error_invalid_domain(self, client):
+    async def test_extract_validation_error_invalid_domain(self, client):
         """Test validation error for invalid domain format."""
         request_data = {
             "company_name": "TestCorp",
             "domain": "not..a..valid..domain"
         }
         
-        response = client.post("/api/v1/company/extract", json=request_data)
+        response = await client.post("/api/v1/company/extract", json=request_data)
         
         assert response.status_code == 422
         data = response.json()
         assert "validation_error" in data["type"]
     
-    def test_extract_with_defaults(self, client):
+    async def test_extract_with_defaults(self, client):
         """Test extraction with default parameters."""
         request_data = {
             "company_name": "TestCorp"
@@ -277,7 +269,7 @@ class TestCompanyExtractionEndpoint:
             mock_service.__aexit__ = AsyncMock()
             mock_service_class.return_value = mock_service
             
-            response = client.post("/api/v1/company/extract", json=request_data)
+            response = await client.post("/api/v1/company/extract", json=request_data)
         
         assert response.status_code == 200
         
@@ -292,7 +284,7 @@ class TestCompanyExtractionEndpoint:
         assert call_args.timeout_seconds == 30
     
     @patch('app.services.company_service.CompanyExtractionService')
-    def test_extract_company_analysis_error(self, mock_service_class, client):
+    async def test_extract_company_analysis_error(self, mock_service_class, client):
         """Test company analysis error handling."""
         # Setup mock to raise CompanyAnalysisError
         mock_service = AsyncMock()
@@ -305,7 +297,7 @@ class TestCompanyExtractionEndpoint:
         
         request_data = {"company_name": "TestCorp"}
         
-        response = client.post("/api/v1/company/extract", json=request_data)
+        response = await client.post("/api/v1/company/extract", json=request_data)
         
         assert response.status_code == 400
         data = response.json()
@@ -313,7 +305,7 @@ class TestCompanyExtractionEndpoint:
         assert data["type"] == "company_analysis_error"
     
     @patch('app.services.company_service.CompanyExtractionService')
-    def test_extract_unexpected_error(self, mock_service_class, client):
+    async def test_extract_unexpected_error(self, mock_service_class, client):
         """Test unexpected error handling."""
         # Setup mock to raise unexpected error
         mock_service = AsyncMock()
@@ -326,164 +318,159 @@ class TestCompanyExtractionEndpoint:
         
         request_data = {"company_name": "TestCorp"}
         
-        response = client.post("/api/v1/company/extract", json=request_data)
+        response = await client.post("/api/v1/company/extract", json=request_data)
         
         assert response.status_code == 500
         data = response.json()
         assert data["error"] == "Internal server error"
         assert data["type"] == "server_error"
     
-    def test_extract_different_extraction_modes(self, client):
+    @pytest.mark.parametrize("mode", ["basic", "comprehensive", "contact_focused", "financial_focused"])
+    async def test_extract_different_extraction_modes(self, client, mode):
         """Test extraction with different extraction modes."""
-        modes = ["basic", "comprehensive", "contact_focused", "financial_focused"]
+        request_data = {
+            "company_name": "TestCorp",
+            "extraction_mode": mode
+        }
         
-        for mode in modes:
-            request_data = {
-                "company_name": "TestCorp",
-                "extraction_mode": mode
-            }
-            
-            with patch('app.services.company_service.CompanyExtractionService') as mock_service_class:
-                mock_service = AsyncMock()
-                mock_response = CompanyExtractionResponse(
-                    request_id="test_12345678",
-                    company_name="TestCorp",
-                    success=True,
-                    company_information=CompanyInformation(
-                        basic_info=CompanyBasicInfo(name="TestCorp")
-                    ),
-                    extraction_metadata=ExtractionMetadata(
-                        pages_crawled=1,
-                        pages_attempted=1,
-                        extraction_time=10.0,
-                        extraction_mode_used=getattr(ExtractionMode, mode.upper())
-                    ),
-                    processing_time=11.0
-                )
-                mock_service.extract_company_information = AsyncMock(return_value=mock_response)
-                mock_service.__aenter__ = AsyncMock(return_value=mock_service)
-                mock_service.__aexit__ = AsyncMock()
-                mock_service_class.return_value = mock_service
-                
-                response = client.post("/api/v1/company/extract", json=request_data)
-            
-            assert response.status_code == 200
+        with patch('app.services.company_service.CompanyExtractionService') as mock_service_class:
+            mock_service = AsyncMock()
+            mock_response = CompanyExtractionResponse(
+                request_id="test_12345678",
+                company_name="TestCorp",
+                success=True,
+                company_information=CompanyInformation(
+                    basic_info=CompanyBasicInfo(name="TestCorp")
+                ),
+                extraction_metadata=ExtractionMetadata(
+                    pages_crawled=1,
+                    pages_attempted=1,
+                    extraction_time=10.0,
+                    extraction_mode_used=getattr(ExtractionMode, mode.upper())
+                ),
+                processing_time=11.0
+            )
+            mock_service.extract_company_information = AsyncMock(return_value=mock_response)
+            mock_service.__aenter__ = AsyncMock(return_value=mock_service)
+            mock_service.__aexit__ = AsyncMock()
+            mock_service_class.return_value = mock_service
             
-            # Verify correct mode was passed
-            mock_service.extract_company_information.assert_called_once()
-            call_args = mock_service.extract_company_information.call_args[0][0]
-            assert call_args.extraction_mode.value == mode
+            response = await client.post("/api/v1/company/extract", json=request_data)
+        
+        assert response.status_code == 200
+        
+        # Verify correct mode was passed
+        mock_service.extract_company_information.assert_called_once()
+        call_args = mock_service.extract_company_information.call_args[0][0]
+        assert call_args.extraction_mode.value == mode
     
-    def test_extract_different_countries_languages(self, client):
+    @pytest.mark.parametrize("country,language", [
+        ("GB", "en"),
+        ("FR", "fr"),
+        ("DE", "de"),
+        ("JP", "ja"),
+    ])
+    async def test_extract_different_countries_languages(self, client, country, language):
         """Test extraction with different country and language combinations."""
-        test_cases = [
-            {"country": "GB", "language": "en"},
-            {"country": "FR", "language": "fr"},
-            {"country": "DE", "language": "de"},
-            {"country": "JP", "language": "ja"},
-        ]
+        request_data = {
+            "company_name": "TestCorp",
+            "country": country,
+            "language": language
+        }
         
-        for case in test_cases:
-            request_data = {
-                "company_name": "TestCorp",
-                **case
-            }
-            
-            with patch('app.services.company_service.CompanyExtractionService') as mock_service_class:
-                mock_service = AsyncMock()
-                mock_response = CompanyExtractionResponse(
-                    request_id="test_12345678",
-                    company_name="TestCorp",
-                    success=True,
-                    company_information=CompanyInformation(
-                        basic_info=CompanyBasicInfo(name="TestCorp")
-                    ),
-                    extraction_metadata=ExtractionMetadata(
-                        pages_crawled=1,
-                        pages_attempted=1,
-                        extraction_time=10.0,
-                        extraction_mode_used=ExtractionMode.COMPREHENSIVE
-                    ),
-                    processing_time=11.0
-                )
-                mock_service.extract_company_information = AsyncMock(return_value=mock_response)
-                mock_service.__aenter__ = AsyncMock(return_value=mock_service)
-                mock_service.__aexit__ = AsyncMock()
-                mock_service_class.return_value = mock_service
-                
-                response = client.post("/api/v1/company/extract", json=request_data)
-            
-            assert response.status_code == 200
+        with patch('app.services.company_service.CompanyExtractionService') as mock_service_class:
+            mock_service = AsyncMock()
+            mock_response = CompanyExtractionResponse(
+                request_id="test_12345678",
+                company_name="TestCorp",
+                success=True,
+                company_information=CompanyInformation(
+                    basic_info=CompanyBasicInfo(name="TestCorp")
+                ),
+                extraction_metadata=ExtractionMetadata(
+                    pages_crawled=1,
+                    pages_attempted=1,
+                    extraction_time=10.0,
+                    extraction_mode_used=ExtractionMode.COMPREHENSIVE
+                ),
+                processing_time=11.0
+            )
+            mock_service.extract_company_information = AsyncMock(return_value=mock_response)
+            mock_service.__aenter__ = AsyncMock(return_value=mock_service)
+            mock_service.__aexit__ = AsyncMock()
+            mock_service_class.return_value = mock_service
             
-            # Verify correct parameters were passed
-            mock_service.extract_company_information.assert_called_once()
-            call_args = mock_service.extract_company_information.call_args[0][0]
-            assert call_args.country == case["country"]
-            assert call_args.language == case["language"]
+            response = await client.post("/api/v1/company/extract", json=request_data)
+        
+        assert response.status_code == 200
+        
+        # Verify correct parameters were passed
+        mock_service.extract_company_information.assert_called_once()
+        call_args = mock_service.extract_company_information.call_args[0][0]
+        assert call_args.country == country
+        assert call_args.language == language
     
-    def test_extract_various_configurations(self, client):
+    @pytest.mark.parametrize("config", [
+        {
+            "include_subsidiaries": True,
+            "include_social_media": False,
+            "include_financial_data": False,
+            "include_contact_info": True,
+            "include_key_personnel": False,
+            "max_pages_to_crawl": 3,
+            "timeout_seconds": 60
+        },
+        {
+            "include_subsidiaries": False,
+            "include_social_media": True,
+            "include_financial_data": True,
+            "include_contact_info": False,
+            "include_key_personnel": True,
+            "max_pages_to_crawl": 10,
+            "timeout_seconds": 90
+        }
+    ], ids=["contact_only", "full_profile"])
+    async def test_extract_various_configurations(self, client, config):
         """Test extraction with various configuration combinations."""
-        configurations = [
-            {
-                "include_subsidiaries": True,
-                "include_social_media": False,
-                "include_financial_data": False,
-                "include_contact_info": True,
-                "include_key_personnel": False,
-                "max_pages_to_crawl": 3,
-                "timeout_seconds": 60
-            },
-            {
-                "include_subsidiaries": False,
-                "include_social_media": True,
-                "include_financial_data": True,
-                "include_contact_info": False,
-                "include_key_personnel": True,
-                "max_pages_to_crawl": 10,
-                "timeout_seconds": 90
-            }
-        ]
+        request_data = {
+            "company_name": "TestCorp",
+            **config
+        }
         
-        for config in configurations:
-            request_data = {
-                "company_name": "TestCorp",
-                **config
-            }
-            
-            with patch('app.services.company_service.CompanyExtractionService') as mock_service_class:
-                mock_service = AsyncMock()
-                mock_response = CompanyExtractionResponse(
-                    request_id="test_12345678",
-                    company_name="TestCorp",
-                    success=True,
-                    company_information=CompanyInformation(
-                        basic_info=CompanyBasicInfo(name="TestCorp")
-                    ),
-                    extraction_metadata=ExtractionMetadata(
-                        pages_crawled=1,
-                        pages_attempted=1,
-                        extraction_time=10.0,
-                        extraction_mode_used=ExtractionMode.COMPREHENSIVE
-                    ),
-                    processing_time=11.0
-                )
-                mock_service.extract_company_information = AsyncMock(return_value=mock_response)
-                mock_service.__aenter__ = AsyncMock(return_value=mock_service)
-                mock_service.__aexit__ = AsyncMock()
-                mock_service_class.return_value = mock_service
-                
-                response = client.post("/api/v1/company/extract", json=request_data)
-            
-            assert response.status_code == 200
-            
-            # Verify all configuration options were passed correctly
-            mock_service.extract_company_information.assert_called_once()
-            call_args = mock_service.extract_company_information.call_args[0][0]
+        with patch('app.services.company_service.CompanyExtractionService') as mock_service_class:
+            mock_service = AsyncMock()
+            mock_response = CompanyExtractionResponse(
+                request_id="test_12345678",
+                company_name="TestCorp",
+                success=True,
+                company_information=CompanyInformation(
+                    basic_info=CompanyBasicInfo(name="TestCorp")
+                ),
+                extraction_metadata=ExtractionMetadata(
+                    pages_crawled=1,
+                    pages_attempted=1,
+                    extraction_time=10.0,
+                    extraction_mode_used=ExtractionMode.COMPREHENSIVE
+                ),
+                processing_time=11.0
+            )
+            mock_service.extract_company_information = AsyncMock(return_value=mock_response)
+            mock_service.__aenter__ = AsyncMock(return_value=mock_service)
+            mock_service.__aexit__ = AsyncMock()
+            mock_service_class.return_value = mock_service
             
-            for key, value in config.items():
-                assert getattr(call_args, key) == value
+            response = await client.post("/api/v1/company/extract", json=request_data)
+        
+        assert response.status_code == 200
+        
+        # Verify all configuration options were passed correctly
+        mock_service.extract_company_information.assert_called_once()
+        call_args = mock_service.extract_company_information.call_args[0][0]
+        
+        for key, value in config.items():
+            assert getattr(call_args, key) == value
     
-    def test_extract_failed_extraction_response(self, client):
+    async def test_extract_failed_extraction_response(self, client):
         """Test response when extraction fails but doesn't raise exception."""
         failed_response = CompanyExtractionResponse(
             request_id="req_failed123",
@@ -520,7 +507,7 @@ class TestCompanyExtractionEndpoint:
             mock_service_class.return_value = mock_service
             
             request_data = {"company_name": "FailedCorp"}
-            response = client.post("/api/v1/company/extract", json=request_data)
+            response = await client.post("/api/v1/company/extract", json=request_data)
         
         assert response.status_code == 200  # Still returns 200 for controlled failure
         
@@ -534,12 +521,13 @@ class TestCompanyExtractionEndpoint:
         assert "Limited data availability" in data["warnings"]
 
 
+@pytest.mark.asyncio(loop_scope="session")
 class TestCompanyStatusEndpoint:
     """Test cases for the /api/v1/company/status endpoint."""
     
-    def test_status_endpoint_exists(self, client):
+    async def test_status_endpoint_exists(self, client):
         """Test that the status endpoint is accessible."""
-        response = client.get("/api/v1/company/status")
+        response = await client.get("/api/v1/company/status")
         
         # Should return status information
         assert response.status_code == 200
@@ -548,7 +536,7 @@ class TestCompanyStatusEndpoint:
         assert "status" in data
     
     @patch('app.services.company_service.CompanyExtractionService.get_service_status')
-    def test_status_success(self, mock_get_status, client):
+    async def test_status_success(self, mock_get_status, client):
         """Test successful status check."""
         mock_status = {
             "status": "operational",
@@ -567,7 +555,7 @@ class TestCompanyStatusEndpoint:
             mock_service.get_service_status = AsyncMock(return_value=mock_status)
             mock_service_class.return_value = mock_service
             
-            response = client.get("/api/v1/company/status")
+            response = await client.get("/api/v1/company/status")
         
         assert response.status_code == 200
         data = response.json()
@@ -579,12 +567,12 @@ class TestCompanyStatusEndpoint:
         assert "dependencies" in data
     
     @patch('app.services.company_service.CompanyExtractionService')
-    def test_status_service_error(self, mock_service_class, client):
+    async def test_status_service_error(self, mock_service_class, client):
         """Test status when service initialization fails."""
         # Setup mock to raise error
         mock_service_class.side_effect = Exception("Service initialization failed")
         
-        response = client.get("/api/v1/company/status")
+        response = await client.get("/api/v1/company/status")
         
         assert response.status_code == 503
         data = response.json()
@@ -594,10 +582,11 @@ class TestCompanyStatusEndpoint:
         assert "Service initialization failed" in data["error"]
 
 
+@pytest.mark.asyncio(loop_scope="session")
 class TestRequestResponseValidation:
     """Test request/response validation through the API."""
     
-    def test_request_model_validation_comprehensive(self, client):
+    async def test_request_model_validation_comprehensive(self, client):
         """Test that request model validation works through the API."""
         valid_requests = [
             {
@@ -649,12 +638,12 @@ class TestRequestResponseValidation:
                 mock_service.__aexit__ = AsyncMock()
                 mock_service_class.return_value = mock_service
                 
-                response = client.post("/api/v1/company/extract", json=request_data)
+                response = await client.post("/api/v1/company/extract", json=request_data)
             
             # Should not fail validation
             assert response.status_code == 200, f"Request failed validation: {request_data}"
     
-    def test_request_model_validation_invalid_cases(self, client):
+    async def test_request_model_validation_invalid_cases(self, client):
         """Test invalid request data is properly rejected."""
         invalid_requests = [
             {"company_name": ""},  # Empty company name
@@ -670,17 +659,18 @@ class TestRequestResponseValidation:
         ]
         
         for request_data in invalid_requests:
-            response = client.post("/api/v1/company/extract", json=request_data)
+            response = await client.post("/api/v1/company/extract", json=request_data)
             assert response.status_code == 422, f"Request should have failed validation: {request_data}"
             data = response.json()
             assert data["type"] == "validation_error"
 
 
+@pytest.mark.asyncio(loop_scope="session")
 class TestErrorHandlingIntegration:
     """Test error handling integration through the router."""
     
     @patch('app.services.company_service.CompanyExtractionService')
-    def test_service_timeout_error_handling(self, mock_service_class, client):
+    async def test_service_timeout_error_handling(self, mock_service_class, client):
         """Test handling of service timeout errors."""
         mock_service = AsyncMock()
         mock_service.extract_company_information = AsyncMock(
@@ -691,14 +681,14 @@ class TestErrorHandlingIntegration:
         mock_service_class.return_value = mock_service
         
         request_data = {"company_name": "TimeoutCorp"}
-        response = client.post("/api/v1/company/extract", json=request_data)
+        response = await client.post("/api/v1/company/extract", json=request_data)
         
         assert response.status_code == 500
         data = response.json()
         assert data["type"] == "server_error"
     
     @patch('app.services.company_service.CompanyExtractionService')  
-    def test_service_connection_error_handling(self, mock_service_class, client):
+    async def test_service_connection_error_handling(self, mock_service_class, client):
         """Test handling of service connection errors."""
         mock_service = AsyncMock()
         mock_service.extract_company_information = AsyncMock(
@@ -709,16 +699,16 @@ class TestErrorHandlingIntegration:
         mock_service_class.return_value = mock_service
         
         request_data = {"company_name": "ConnectionCorp"}
-        response = client.post("/api/v1/company/extract", json=request_data)
+        response = await client.post("/api/v1/company/extract", json=request_data)
         
         assert response.status_code == 500
         data = response.json()
         assert data["type"] == "server_error"
     
-    def test_malformed_json_request(self, client):
+    async def test_malformed_json_request(self, client):
         """Test handling of malformed JSON requests."""
         # Send malformed JSON
-        response = client.post(
+        response = await client.post(
             "/api/v1/company/extract",
             content='{"company_name": "TestCorp", invalid json}',
             headers={"Content-Type": "application/json"}
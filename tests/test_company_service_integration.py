@@ -1,136 +1,186 @@
 """Integration test for CompanyExtractionService - demonstrates real usage."""
 
 import asyncio
+import logging
+import re
 import pytest
-from unittest.mock import patch, AsyncMock
+from collections import Counter
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 from app.services.company_service import CompanyExtractionService
-from app.models.company import CompanyInformationRequest, ExtractionMode
+from app.models.company import (
+    CompanyInformationRequest, CompanyInformation, CompanyBasicInfo, ExtractionMode
+)
+
+logger = logging.getLogger(__name__)
+
+MOCK_SEARCH_RESULTS = [
+    {
+        "rank": 1,
+        "title": "TechCorp Inc - About Us",
+        "url": "https://techcorp.com/about",
+        "description": "TechCorp Inc is a leading technology company."
+    },
+    {
+        "rank": 2,
+        "title": "TechCorp Inc - Contact",
+        "url": "https://techcorp.com/contact",
+        "description": "Contact TechCorp Inc for business inquiries."
+    }
+]
+
+MOCK_CRAWLED_HTML = """
+<html><body>
+    <h1>TechCorp Inc</h1>
+    <p>TechCorp Inc is a leading technology company founded in 2010.</p>
+    <p>Contact us at info@techcorp.com or call +1-555-123-4567</p>
+    <p>Our headquarters is located at 123 Tech Street, San Francisco, CA 94105</p>
+    <a href="https://linkedin.com/company/techcorp">LinkedIn</a>
+</body></html>
+"""
+
+# Read-only requests shared across tests (the service never mutates them)
+_TECHCORP_REQUEST = CompanyInformationRequest(
+    company_name="TechCorp Inc",
+    domain="techcorp.com",
+    extraction_mode=ExtractionMode.COMPREHENSIVE,
+    country="US",
+    language="en",
+    max_pages_to_crawl=2,
+    timeout_seconds=15
+)
+
+_INNOVATION_LABS_REQUEST = CompanyInformationRequest(
+    company_name="Innovation Labs",
+    domain="innovationlabs.io",
+    extraction_mode=ExtractionMode.COMPREHENSIVE,
+    include_social_media=True,
+    include_financial_data=True,
+    include_contact_info=True,
+    include_key_personnel=True
+)
+
+_DATACORP_REQUEST = CompanyInformationRequest(
+    company_name="DataCorp",
+    domain="datacorp.com"
+)
+
+# Keyword -> category table for search query categorization
+_QUERY_CATEGORY_KEYWORDS = {
+    'contact': 'contact',
+    'linkedin': 'social',
+    'twitter': 'social',
+    'funding': 'financial',
+    'revenue': 'financial',
+    'crunchbase': 'financial',
+    'ceo': 'personnel',
+    'founder': 'personnel',
+    'leadership': 'personnel',
+}
+_QUERY_CATEGORY_PATTERN = re.compile('|'.join(_QUERY_CATEGORY_KEYWORDS), re.IGNORECASE)
+
+_DUMMY_COMPANY_INFO = CompanyInformation(
+    basic_info=CompanyBasicInfo(name="TechCorp Inc", domain="techcorp.com"),
+    confidence_score=0.5
+)
+
+
+def _make_serp_stub():
+    """Build a SERPService stand-in returning MOCK_SEARCH_RESULTS."""
+    search_response = SimpleNamespace(organic_results=[
+        SimpleNamespace(url=r["url"], title=r["title"], description=r["description"])
+        for r in MOCK_SEARCH_RESULTS
+    ])
+    stub = AsyncMock()
+    stub.search = AsyncMock(return_value=search_response)
+    return stub
+
+
+def _make_crawl_stub():
+    """Build a CrawlService stand-in returning a successful crawl of MOCK_CRAWLED_HTML."""
+    crawl_response = SimpleNamespace(
+        success=True,
+        result=SimpleNamespace(
+            url="https://techcorp.com/about",
+            title="TechCorp Inc - About Us",
+            cleaned_html=MOCK_CRAWLED_HTML,
+            metadata={"word_count": 150}
+        ),
+        execution_time=2.1
+    )
+    stub = AsyncMock()
+    stub.crawl = AsyncMock(return_value=crawl_response)
+    return stub
+
+
+@pytest.fixture
+def patched_services(monkeypatch):
+    """Replace SERPService/CrawlService in the company service with prebuilt stubs."""
+    stubs = SimpleNamespace(serp=_make_serp_stub(), crawl=_make_crawl_stub())
+    monkeypatch.setattr('app.services.company_service.SERPService', lambda *a, **kw: stubs.serp)
+    monkeypatch.setattr('app.services.company_service.CrawlService', lambda *a, **kw: stubs.crawl)
+    yield stubs
 
 
 class TestCompanyExtractionServiceIntegration:
     """Integration tests for CompanyExtractionService."""
     
+    @staticmethod
+    async def _run_comprehensive_extraction(service):
+        """Run a comprehensive extraction for TechCorp Inc through ``service``."""
+        async with service:
+            return await service.extract_company_information(_TECHCORP_REQUEST)
+    
+    @staticmethod
+    def _assert_response_structure(response, patched_services):
+        """Structural checks shared by the fast and full-path workflow tests."""
+        assert response is not None
+        assert response.company_name == "TechCorp Inc"
+        assert isinstance(response.success, bool)
+        assert response.processing_time > 0
+        assert response.extraction_metadata is not None
+        assert response.extraction_metadata.extraction_mode_used == ExtractionMode.COMPREHENSIVE
+        
+        # Validate that services were called
+        patched_services.serp.search.assert_called()
+        patched_services.crawl.crawl.assert_called()
+    
     @pytest.mark.asyncio
-    async def test_service_with_mocked_dependencies(self):
-        """Test the full service workflow with mocked dependencies."""
-        # Create a comprehensive request
-        request = CompanyInformationRequest(
-            company_name="TechCorp Inc",
-            domain="techcorp.com",
-            extraction_mode=ExtractionMode.COMPREHENSIVE,
-            country="US",
-            language="en",
-            max_pages_to_crawl=2,
-            timeout_seconds=15
+    async def test_service_with_mocked_dependencies(self, patched_services, monkeypatch):
+        """Test the service workflow structure with the HTML parser stubbed out."""
+        service = CompanyExtractionService()
+        monkeypatch.setattr(
+            service.company_parser, 'extract_company_information',
+            lambda *a, **kw: _DUMMY_COMPANY_INFO
         )
         
-        # Mock the actual external services
-        mock_search_response_data = {
-            "query": "TechCorp Inc company information",
-            "results_count": 2,
-            "organic_results": [
-                {
-                    "rank": 1,
-                    "title": "TechCorp Inc - About Us",
-                    "url": "https://techcorp.com/about",
-                    "description": "TechCorp Inc is a leading technology company."
-                },
-                {
-                    "rank": 2,
-                    "title": "TechCorp Inc - Contact",
-                    "url": "https://techcorp.com/contact",
-                    "description": "Contact TechCorp Inc for business inquiries."
-                }
-            ]
-        }
-        
-        mock_crawl_response_data = {
-            "success": True,
-            "result": {
-                "url": "https://techcorp.com/about",
-                "title": "TechCorp Inc - About Us", 
-                "cleaned_html": """
-                <html><body>
-                    <h1>TechCorp Inc</h1>
-                    <p>TechCorp Inc is a leading technology company founded in 2010.</p>
-                    <p>Contact us at info@techcorp.com or call +1-555-123-4567</p>
-                    <p>Our headquarters is located at 123 Tech Street, San Francisco, CA 94105</p>
-                    <a href="https://linkedin.com/company/techcorp">LinkedIn</a>
-                </body></html>
-                """,
-                "metadata": {"word_count": 150}
-            },
-            "execution_time": 2.1
-        }
+        response = await self._run_comprehensive_extraction(service)
         
+        self._assert_response_structure(response, patched_services)
+    
+    @pytest.mark.slow
+    @pytest.mark.asyncio
+    async def test_service_with_mocked_dependencies_full_parse(self, patched_services):
+        """Test the full service workflow, including HTML parsing, with mocked dependencies."""
         service = CompanyExtractionService()
         
-        # Mock the external dependencies
-        with patch('app.services.company_service.SERPService') as mock_serp_class, \
-             patch('app.services.company_service.CrawlService') as mock_crawl_class:
-            
-            # Create mock instances
-            mock_serp_instance = AsyncMock()
-            mock_crawl_instance = AsyncMock()
-            
-            # Configure mock classes to return instances
-            mock_serp_class.return_value = mock_serp_instance
-            mock_crawl_class.return_value = mock_crawl_instance
-            
-            # Configure mock SERP service
-            mock_search_response = AsyncMock()
-            mock_search_response.organic_results = []
-            for result_data in mock_search_response_data["organic_results"]:
-                mock_result = AsyncMock()
-                mock_result.url = result_data["url"]
-                mock_result.title = result_data["title"]
-                mock_result.description = result_data["description"]
-                mock_search_response.organic_results.append(mock_result)
-            
-            mock_serp_instance.search = AsyncMock(return_value=mock_search_response)
-            
-            # Configure mock crawl service
-            mock_crawl_response = AsyncMock()
-            mock_crawl_response.success = True
-            mock_crawl_response.result = AsyncMock()
-            mock_crawl_response.result.cleaned_html = mock_crawl_response_data["result"]["cleaned_html"]
-            mock_crawl_response.result.title = mock_crawl_response_data["result"]["title"]
-            mock_crawl_response.result.metadata = mock_crawl_response_data["result"]["metadata"]
-            mock_crawl_response.execution_time = mock_crawl_response_data["execution_time"]
-            
-            mock_crawl_instance.crawl = AsyncMock(return_value=mock_crawl_response)
-            
-            # Execute the service
-            async with service:
-                response = await service.extract_company_information(request)
-            
-            # Validate response structure
-            assert response is not None
-            assert response.company_name == "TechCorp Inc"
-            assert isinstance(response.success, bool)
-            assert response.processing_time > 0
-            assert response.extraction_metadata is not None
-            assert response.extraction_metadata.extraction_mode_used == ExtractionMode.COMPREHENSIVE
-            
-            # Validate that services were called
-            mock_serp_instance.search.assert_called()
-            mock_crawl_instance.crawl.assert_called()
-            
-            print(f"✅ Integration test passed!")
-            print(f"   - Company: {response.company_name}")
-            print(f"   - Success: {response.success}")
-            print(f"   - Processing time: {response.processing_time:.2f}s")
-            print(f"   - Pages attempted: {response.extraction_metadata.pages_attempted}")
-            print(f"   - Pages crawled: {response.extraction_metadata.pages_crawled}")
-            print(f"   - Errors: {len(response.errors)}")
-            print(f"   - Warnings: {len(response.warnings)}")
-            
-            if response.company_information:
-                print(f"   - Company info extracted: ✅")
-                print(f"   - Confidence: {response.company_information.confidence_score}")
-            else:
-                print(f"   - Company info extracted: ❌")
+        response = await self._run_comprehensive_extraction(service)
+        
+        self._assert_response_structure(response, patched_services)
+        
+        logger.debug(
+            "Integration test passed: company=%s success=%s processing_time=%.2fs "
+            "pages_attempted=%d pages_crawled=%d errors=%d warnings=%d confidence=%s",
+            response.company_name,
+            response.success,
+            response.processing_time,
+            response.extraction_metadata.pages_attempted,
+            response.extraction_metadata.pages_crawled,
+            len(response.errors),
+            len(response.warnings),
+            response.company_information.confidence_score if response.company_information else None
+        )
     
     def test_service_creation_and_basic_properties(self):
         """Test that service can be created and has expected properties."""
@@ -147,25 +197,13 @@ class TestCompanyExtractionServiceIntegration:
         assert hasattr(service, '_generate_search_queries')
         assert hasattr(service, '_score_url_priority')
         assert hasattr(service, '_aggregate_company_information')
-        
-        print("✅ Service creation and basic properties test passed!")
     
     def test_search_query_generation_comprehensive(self):
         """Test search query generation for different modes."""
         service = CompanyExtractionService()
         
         # Test comprehensive mode with all features enabled
-        request = CompanyInformationRequest(
-            company_name="Innovation Labs",
-            domain="innovationlabs.io",
-            extraction_mode=ExtractionMode.COMPREHENSIVE,
-            include_social_media=True,
-            include_financial_data=True,
-            include_contact_info=True,
-            include_key_personnel=True
-        )
-        
-        queries = service._generate_search_queries(request)
+        queries = service._generate_search_queries(_INNOVATION_LABS_REQUEST)
         
         # Should generate multiple types of queries
         assert len(queries) > 8  # Comprehensive should have many queries
@@ -174,39 +212,29 @@ class TestCompanyExtractionServiceIntegration:
         domain_queries = [q for q in queries if 'site:innovationlabs.io' in q]
         assert len(domain_queries) > 0
         
-        # Should include contact queries
-        contact_queries = [q for q in queries if 'contact' in q.lower()]
-        assert len(contact_queries) > 0
-        
-        # Should include social media queries
-        social_queries = [q for q in queries if any(platform in q.lower() for platform in ['linkedin', 'twitter'])]
-        assert len(social_queries) > 0
-        
-        # Should include financial queries
-        financial_queries = [q for q in queries if any(term in q.lower() for term in ['funding', 'revenue', 'crunchbase'])]
-        assert len(financial_queries) > 0
-        
-        # Should include personnel queries
-        personnel_queries = [q for q in queries if any(term in q.lower() for term in ['ceo', 'founder', 'leadership'])]
-        assert len(personnel_queries) > 0
-        
-        print("✅ Comprehensive search query generation test passed!")
-        print(f"   - Total queries: {len(queries)}")
-        print(f"   - Domain queries: {len(domain_queries)}")
-        print(f"   - Contact queries: {len(contact_queries)}")
-        print(f"   - Social queries: {len(social_queries)}")
-        print(f"   - Financial queries: {len(financial_queries)}")
-        print(f"   - Personnel queries: {len(personnel_queries)}")
+        # Categorize every query in a single scan
+        category_counts = Counter()
+        for query in queries:
+            category_counts.update({
+                _QUERY_CATEGORY_KEYWORDS[match.lower()]
+                for match in _QUERY_CATEGORY_PATTERN.findall(query)
+            })
+        
+        # Should include contact, social media, financial and personnel queries
+        assert category_counts['contact'] > 0
+        assert category_counts['social'] > 0
+        assert category_counts['financial'] > 0
+        assert category_counts['personnel'] > 0
+        
+        logger.debug(
+            "Query generation: total=%d domain=%d categories=%s",
+            len(queries), len(domain_queries), dict(category_counts)
+        )
     
     def test_url_priority_scoring_comprehensive(self):
         """Test URL priority scoring for various scenarios."""
         service = CompanyExtractionService()
         
-        request = CompanyInformationRequest(
-            company_name="DataCorp",
-            domain="datacorp.com"
-        )
-        
         # Test scenarios with expected relative priorities
         test_urls = [
             # Official domain pages (should be highest)
@@ -224,12 +252,14 @@ class TestCompanyExtractionServiceIntegration:
             ("https://facebook.com/datacorp", "DataCorp on Facebook", "DataCorp Facebook page", "low"),
         ]
         
+        items = [(url, title, description) for url, title, description, _ in test_urls]
+        scores_list = service._score_url_priorities(items, _DATACORP_REQUEST)
+        
         scores = {}
-        for url, title, description, expected_tier in test_urls:
-            score = service._score_url_priority(url, title, description, request)
+        for (_, _, _, expected_tier), score in zip(test_urls, scores_list):
             scores[expected_tier] = scores.get(expected_tier, [])
             scores[expected_tier].append(score)
-            print(f"   - {url}: {score:.3f} (expected: {expected_tier})")
+        logger.debug("URL priority scores by tier: %s", scores)
         
         # Validate relative priorities
         if "high" in scores and "medium-high" in scores:
@@ -240,8 +270,6 @@ class TestCompanyExtractionServiceIntegration:
         
         if "medium" in scores and "low" in scores:
             assert max(scores["medium"]) >= max(scores["low"])
-        
-        print("✅ URL priority scoring test passed!")
 
 
 if __name__ == "__main__":
@@ -2,14 +2,17 @@
 
 import pytest
 from fastapi.testclient import TestClient
-from main import app
 
-client = TestClient(app)
 
+@pytest.fixture(scope="module")
+def http_client(app):
+    """Test client over the session-wide application."""
+    return TestClient(app)
 
-def test_health_check():
+
+def test_health_check(http_client):
     """Test basic health check endpoint."""
-    response = client.get("/api/v1/health")
+    response = http_client.get("/api/v1/health")
     assert response.status_code == 200
     
     data = response.json()
@@ -18,9 +21,9 @@ def test_health_check():
     assert data["service"] == "Google SERP + Crawl4ai API"
 
 
-def test_detailed_health_check():
+def test_detailed_health_check(http_client):
     """Test detailed health check endpoint."""
-    response = client.get("/api/v1/health/detailed")
+    response = http_client.get("/api/v1/health/detailed")
     assert response.status_code == 200
     
     data = response.json()
@@ -7,14 +7,22 @@ to validate the API endpoint behavior, pagination connectivity, and proxy impact
 """
 
 import asyncio
-import json
+import hashlib
 import logging
+import random
 import time
 import sys
 import os
-from typing import Dict, Any, List, Optional
+from pathlib import Path
+from typing import BinaryIO, Dict, Any, Iterator, List, Optional, Set, Tuple, Union
 from datetime import datetime
 import httpx
+import orjson
+
+try:
+    import uvloop
+except ImportError:  # uvloop is unavailable on Windows
+    uvloop = None
 
 # Add the app directory to the path so we can import our modules
 sys.path.append(os.path.join(os.path.dirname(__file__), 'app'))
@@ -22,10 +30,45 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'app'))
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%H:%M:%S'
 )
 logger = logging.getLogger(__name__)
 
+# Shared stand-in for a missing first result; never mutated
+_EMPTY_RESULT: Dict[str, Any] = {}
+
+
+def _summarize_page(
+    results: List[Dict[str, Any]],
+    seen_urls: Optional[Set[str]] = None
+) -> Tuple[Set[str], float, int, Set[str]]:
+    """
+    Summarize a page of organic results in a single pass.
+    
+    Returns the page's URL set, its lowest rank (``inf`` if none), its highest
+    rank (0 if none) and the subset of its URLs already present in ``seen_urls``.
+    """
+    urls = set()
+    overlap = set()
+    first_rank = float('inf')
+    last_rank = 0
+    
+    for result in results:
+        url = result['url']
+        urls.add(url)
+        if seen_urls is not None and url in seen_urls:
+            overlap.add(url)
+        
+        rank = result.get('rank')
+        if rank is not None:
+            if rank < first_rank:
+                first_rank = rank
+            if rank > last_rank:
+                last_rank = rank
+    
+    return urls, first_rank, last_rank, overlap
+
 
 class IndonesiaFashionTester:
     """Specialized tester for Indonesian fashion queries."""
@@ -36,10 +79,12 @@ class IndonesiaFashionTester:
         self.search_endpoint = f"{self.base_url}/api/v1/search"
         self.batch_endpoint = f"{self.base_url}/api/v1/search"  # Updated to unified endpoint
         
-        # HTTP client
+        # HTTP client shared by all concurrent tests; the pool limit keeps the
+        # simultaneous requests from overwhelming the local API server
         self.client = httpx.AsyncClient(
             timeout=60.0,  # Longer timeout for large result sets
-            headers={"Content-Type": "application/json"}
+            headers={"Content-Type": "application/json"},
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20)
         )
         
         # Test parameters
@@ -50,17 +95,81 @@ class IndonesiaFashionTester:
             "fashion brand indonesia",
             "pakaian trendy"
         ]
+        # Drop duplicate queries (order preserved) so none costs a second round-trip
+        self.fashion_queries = list(dict.fromkeys(self.fashion_queries))
+        self.max_concurrent_queries = 5
+        
+        # Optional on-disk response cache (set SERP_USE_CACHE=1 to reuse responses across runs)
+        self.use_cache = bool(os.getenv("SERP_USE_CACHE"))
+        self.cache_dir = Path(os.getenv("SERP_CACHE_DIR", ".serp_cache"))
+        if self.use_cache:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
         
         # Results storage
         self.test_results: List[Dict[str, Any]] = []
     
+    async def _post_json(self, url: str, payload: Union[Dict[str, Any], bytes]) -> Dict[str, Any]:
+        """
+        POST ``payload`` to ``url`` and decode the JSON body, raising on HTTP errors.
+        
+        ``payload`` may be pre-encoded JSON bytes, which are sent as-is so repeated
+        identical requests skip re-serialization.
+        """
+        if isinstance(payload, bytes):
+            response = await self.client.post(url, content=payload)
+        else:
+            response = await self.client.post(url, json=payload)
+        if response.status_code >= 400:
+            logger.error(f"HTTP {response.status_code} from {url}: {response.text[:200]}")
+            raise RuntimeError(f"HTTP {response.status_code} from {url}")
+        return orjson.loads(response.content)
+    
+    async def _cached_post(self, url: str, payload: Dict[str, Any], ttl: int = 3600) -> Dict[str, Any]:
+        """
+        POST ``payload`` to ``url`` and return the decoded JSON response.
+        
+        When the response cache is enabled, identical requests made within
+        ``ttl`` seconds are served from disk instead of hitting the API.
+        """
+        cache_file = None
+        if self.use_cache:
+            key = hashlib.blake2b(
+                orjson.dumps([url, payload], option=orjson.OPT_SORT_KEYS),
+                digest_size=16
+            ).hexdigest()
+            cache_file = self.cache_dir / f"{key}.json"
+            if cache_file.exists() and time.time() - cache_file.stat().st_mtime < ttl:
+                logger.debug(f"Response cache hit for {url} {payload}")
+                return orjson.loads(cache_file.read_bytes())
+        
+        data = await self._post_json(url, payload)
+        
+        if cache_file is not None:
+            cache_file.write_bytes(orjson.dumps(data))
+        
+        return data
+    
     async def test_single_page_100_results(self) -> Dict[str, Any]:
         """Test single page with 100 results for Indonesian fashion queries."""
         logger.info("🇮🇩 Testing single page with 100 results in Indonesia")
         
-        results = {}
+        # Bound concurrent requests against the API server
+        semaphore = asyncio.Semaphore(self.max_concurrent_queries)
+        timestamp = datetime.now().isoformat()
+        query_results = await asyncio.gather(
+            *(self._test_single_query(query, semaphore, timestamp) for query in self.fashion_queries)
+        )
         
-        for query in self.fashion_queries:
+        return dict(zip(self.fashion_queries, query_results))
+    
+    async def _test_single_query(
+        self,
+        query: str,
+        semaphore: asyncio.Semaphore,
+        timestamp: str
+    ) -> Dict[str, Any]:
+        """Run one 100-result search for ``query`` and analyze the response."""
+        async with semaphore:
             try:
                 logger.info(f"Testing query: '{query}'")
                 
@@ -72,12 +181,9 @@ class IndonesiaFashionTester:
                     "results_per_page": 100
                 }
                 
-                start_time = time.time()
-                response = await self.client.post(self.search_endpoint, json=payload)
-                response.raise_for_status()
-                
-                data = response.json()
-                search_time = time.time() - start_time
+                start_time = time.perf_counter()
+                data = await self._cached_post(self.search_endpoint, payload)
+                search_time = time.perf_counter() - start_time
                 
                 # Analyze results
                 actual_results = data.get('results_count', 0)
@@ -89,42 +195,36 @@ class IndonesiaFashionTester:
                     'requested_results': 100,
                     'actual_results': actual_results,
                     'organic_results_count': len(organic_results),
-                    'search_time': round(search_time, 2),
+                    'search_time': search_time,
                     'total_results_estimate': pagination.get('total_results_estimate'),
                     'has_next_page': pagination.get('has_next_page'),
                     'page_range': f"{pagination.get('page_range_start', 0)}-{pagination.get('page_range_end', 0)}",
                     'success': actual_results > 0,
                     'reached_100': actual_results >= 100,
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': timestamp
                 }
                 
-                results[query] = result_analysis
-                
                 # Log key findings
                 logger.info(f"✅ {query}: {actual_results}/100 results ({search_time:.2f}s)")
                 if actual_results < 100:
                     logger.warning(f"⚠️  {query}: Only got {actual_results}/100 results")
                 
-                # Small delay between queries
-                await asyncio.sleep(1)
+                return result_analysis
                 
             except Exception as e:
                 logger.error(f"❌ Error testing '{query}': {str(e)}")
-                results[query] = {
+                return {
                     'query': query,
                     'error': str(e),
                     'success': False,
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': timestamp
                 }
-        
-        return results
     
     async def test_pagination_connectivity(self, query: str = "fashion") -> Dict[str, Any]:
         """Test if page 1 and page 2 are properly connected."""
         logger.info(f"🔗 Testing pagination connectivity for '{query}'")
         
         try:
-            # Test page 1
             page1_payload = {
                 "query": query,
                 "country": "ID",
@@ -133,14 +233,6 @@ class IndonesiaFashionTester:
                 "results_per_page": 100
             }
             
-            response1 = await self.client.post(self.search_endpoint, json=page1_payload)
-            response1.raise_for_status()
-            page1_data = response1.json()
-            
-            # Small delay to simulate real usage
-            await asyncio.sleep(2)
-            
-            # Test page 2
             page2_payload = {
                 "query": query,
                 "country": "ID", 
@@ -149,22 +241,20 @@ class IndonesiaFashionTester:
                 "results_per_page": 100
             }
             
-            response2 = await self.client.post(self.search_endpoint, json=page2_payload)
-            response2.raise_for_status()
-            page2_data = response2.json()
+            # Fetch both pages concurrently
+            page1_data, page2_data = await asyncio.gather(
+                self._cached_post(self.search_endpoint, page1_payload),
+                self._cached_post(self.search_endpoint, page2_payload)
+            )
             
             # Analyze connectivity
             page1_results = page1_data.get('organic_results', [])
             page2_results = page2_data.get('organic_results', [])
             
-            # Check for URL overlaps (indicating pagination issues)
-            page1_urls = {result['url'] for result in page1_results}
-            page2_urls = {result['url'] for result in page2_results}
-            url_overlap = page1_urls.intersection(page2_urls)
-            
-            # Check rank continuity
-            page1_last_rank = max([r.get('rank', 0) for r in page1_results], default=0)
-            page2_first_rank = min([r.get('rank', float('inf')) for r in page2_results], default=float('inf'))
+            # Collect URLs and rank bounds in one pass per page; URL overlaps
+            # between the pages indicate pagination issues
+            page1_urls, _, page1_last_rank, _ = _summarize_page(page1_results)
+            _, page2_first_rank, _, url_overlap = _summarize_page(page2_results, page1_urls)
             
             # Check pagination metadata consistency
             page1_pagination = page1_data.get('pagination', {})
@@ -226,14 +316,13 @@ class IndonesiaFashionTester:
                 "start_page": 1
             }
             
-            batch_response = await self.client.post(self.batch_endpoint, json=batch_payload)
-            batch_response.raise_for_status()
-            batch_data = batch_response.json()
+            batch_data = await self._cached_post(self.batch_endpoint, batch_payload)
             
             # Extract batch results
             batch_pages = batch_data.get('pages', [])
-            batch_page1 = next((p for p in batch_pages if p['page_number'] == 1), {})
-            batch_page2 = next((p for p in batch_pages if p['page_number'] == 2), {})
+            pages_by_number = {p['page_number']: p for p in batch_pages}
+            batch_page1 = pages_by_number.get(1, {})
+            batch_page2 = pages_by_number.get(2, {})
             
             batch_analysis = {
                 'query': query,
@@ -263,8 +352,7 @@ class IndonesiaFashionTester:
     async def test_proxy_impact_analysis(self, query: str = "fashion", iterations: int = 3) -> Dict[str, Any]:
         """Test multiple requests to analyze proxy rotation impact."""
         logger.info(f"🔄 Testing proxy rotation impact for '{query}' ({iterations} iterations)")
-        
-        request_results = []
+        timestamp = datetime.now().isoformat()
         
         try:
             payload = {
@@ -275,31 +363,36 @@ class IndonesiaFashionTester:
                 "results_per_page": 100
             }
             
-            for i in range(iterations):
-                logger.info(f"Iteration {i+1}/{iterations}")
-                
-                start_time = time.time()
-                response = await self.client.post(self.search_endpoint, json=payload)
-                response.raise_for_status()
-                
-                data = response.json()
-                search_time = time.time() - start_time
-                
-                # Extract key data points
-                iteration_data = {
-                    'iteration': i + 1,
-                    'results_count': data.get('results_count', 0),
-                    'search_time': round(search_time, 2),
-                    'total_results_estimate': data.get('pagination', {}).get('total_results_estimate'),
-                    'first_result_title': data.get('organic_results', [{}])[0].get('title') if data.get('organic_results') else None,
-                    'first_result_url': data.get('organic_results', [{}])[0].get('url') if data.get('organic_results') else None,
-                    'timestamp': datetime.now().isoformat()
-                }
-                
-                request_results.append(iteration_data)
-                
-                # Delay between requests to allow potential proxy rotation
-                await asyncio.sleep(5)
+            # Every iteration sends the same body, so encode it once
+            body = orjson.dumps(payload)
+            
+            # Fire the iterations as a concurrent burst; jitter staggers them slightly
+            semaphore = asyncio.Semaphore(self.max_concurrent_queries)
+            
+            async def run_iteration(i: int) -> Dict[str, Any]:
+                async with semaphore:
+                    await asyncio.sleep(random.uniform(0, 0.5))
+                    logger.info(f"Iteration {i+1}/{iterations}")
+                    
+                    start_time = time.perf_counter()
+                    # Always hit the API: cached responses would hide proxy rotation
+                    data = await self._post_json(self.search_endpoint, body)
+                    search_time = time.perf_counter() - start_time
+                    
+                    # Extract key data points
+                    organic_results = data.get('organic_results')
+                    first_result = organic_results[0] if organic_results else _EMPTY_RESULT
+                    return {
+                        'iteration': i + 1,
+                        'results_count': data.get('results_count', 0),
+                        'search_time': search_time,
+                        'total_results_estimate': data.get('pagination', {}).get('total_results_estimate'),
+                        'first_result_title': first_result.get('title'),
+                        'first_result_url': first_result.get('url'),
+                        'timestamp': timestamp
+                    }
+            
+            request_results = await asyncio.gather(*(run_iteration(i) for i in range(iterations)))
             
             # Analyze consistency across iterations
             result_counts = [r['results_count'] for r in request_results]
@@ -316,7 +409,7 @@ class IndonesiaFashionTester:
                 'first_result_varies': len(set(first_titles)) > 1 if first_titles else False,
                 'detailed_results': request_results,
                 'proxy_rotation_detected': len(set(first_titles)) > 1 or len(set(result_counts)) > 1,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': timestamp
             }
             
             if proxy_analysis['proxy_rotation_detected']:
@@ -332,11 +425,17 @@ class IndonesiaFashionTester:
                 'query': query,
                 'error': str(e),
                 'success': False,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': timestamp
             }
     
-    async def run_comprehensive_test(self) -> Dict[str, Any]:
-        """Run all tests and generate comprehensive report."""
+    async def run_comprehensive_test(self, output_file: Optional[BinaryIO] = None) -> Dict[str, Any]:
+        """
+        Run all tests and generate comprehensive report.
+        
+        If ``output_file`` is given, a header record and then one JSONL record per
+        test are written to it as soon as each test completes, so partial results
+        survive an interrupted run.
+        """
         logger.info("🚀 Starting comprehensive Indonesian fashion API test suite")
         logger.info("=" * 80)
         
@@ -346,85 +445,90 @@ class IndonesiaFashionTester:
             'tests': {}
         }
         
-        # Test 1: Single page 100 results
-        logger.info("\n📋 Test 1: Single page with 100 results")
-        comprehensive_results['tests']['single_page_100'] = await self.test_single_page_100_results()
-        
-        # Test 2: Pagination connectivity  
-        logger.info("\n📋 Test 2: Pagination connectivity")
-        comprehensive_results['tests']['pagination_connectivity'] = await self.test_pagination_connectivity()
+        if output_file is not None:
+            await self._write_record(output_file, {
+                'test_suite': comprehensive_results['test_suite'],
+                'timestamp': comprehensive_results['timestamp']
+            })
         
-        # Test 3: Batch pagination consistency
-        logger.info("\n📋 Test 3: Batch pagination consistency")
-        comprehensive_results['tests']['batch_pagination'] = await self.test_batch_pagination_consistency()
+        async def run_and_record(name: str, test_coro) -> None:
+            data = await test_coro
+            comprehensive_results['tests'][name] = data
+            if output_file is not None:
+                await self._write_record(output_file, {'test': name, 'data': data})
         
-        # Test 4: Proxy impact analysis
-        logger.info("\n📋 Test 4: Proxy rotation impact")
-        comprehensive_results['tests']['proxy_impact'] = await self.test_proxy_impact_analysis()
+        # The four tests are independent, so run them concurrently
+        logger.info("\n📋 Running: single page 100 results, pagination connectivity, "
+                   "batch pagination consistency, proxy rotation impact")
+        await asyncio.gather(
+            run_and_record('single_page_100', self.test_single_page_100_results()),
+            run_and_record('pagination_connectivity', self.test_pagination_connectivity()),
+            run_and_record('batch_pagination', self.test_batch_pagination_consistency()),
+            run_and_record('proxy_impact', self.test_proxy_impact_analysis())
+        )
         
         return comprehensive_results
     
-    def generate_test_report(self, results: Dict[str, Any]) -> str:
-        """Generate a formatted test report."""
-        report_lines = [
-            "📊 INDONESIA FASHION API TEST REPORT",
-            "=" * 60,
-            f"Test Suite: {results['test_suite']}",
-            f"Timestamp: {results['timestamp']}",
-            "=" * 60
-        ]
+    @staticmethod
+    async def _write_record(output_file: BinaryIO, record: Dict[str, Any]) -> None:
+        """Append one JSONL record to ``output_file`` without blocking the event loop."""
+        line = orjson.dumps(record) + b"\n"
+        
+        def write_line():
+            output_file.write(line)
+            output_file.flush()
+        
+        await asyncio.to_thread(write_line)
+    
+    def generate_test_report(self, results: Dict[str, Any]) -> Iterator[str]:
+        """Generate a formatted test report, one line at a time."""
+        yield "📊 INDONESIA FASHION API TEST REPORT"
+        yield "=" * 60
+        yield f"Test Suite: {results['test_suite']}"
+        yield f"Timestamp: {results['timestamp']}"
+        yield "=" * 60
         
         # Single page results summary
         single_page_tests = results['tests'].get('single_page_100', {})
         if isinstance(single_page_tests, dict):
-            report_lines.extend([
-                "\n🔍 SINGLE PAGE 100 RESULTS TEST",
-                "-" * 40
-            ])
+            yield "\n🔍 SINGLE PAGE 100 RESULTS TEST"
+            yield "-" * 40
             
             for query, result in single_page_tests.items():
                 if isinstance(result, dict) and 'actual_results' in result:
                     status = "✅" if result.get('reached_100') else "⚠️ "
-                    report_lines.append(f"{status} {query}: {result['actual_results']}/100 results ({result.get('search_time', 0)}s)")
+                    yield f"{status} {query}: {result['actual_results']}/100 results ({result.get('search_time', 0):.2f}s)"
         
         # Pagination connectivity summary
         pagination_test = results['tests'].get('pagination_connectivity', {})
         if isinstance(pagination_test, dict):
-            report_lines.extend([
-                "\n🔗 PAGINATION CONNECTIVITY TEST",
-                "-" * 40
-            ])
+            yield "\n🔗 PAGINATION CONNECTIVITY TEST"
+            yield "-" * 40
             
             if pagination_test.get('properly_connected'):
-                report_lines.append("✅ Pagination properly connected")
+                yield "✅ Pagination properly connected"
             else:
-                report_lines.append("⚠️  Pagination connectivity issues detected")
+                yield "⚠️  Pagination connectivity issues detected"
             
             if pagination_test.get('url_overlaps', 0) > 0:
-                report_lines.append(f"   - {pagination_test['url_overlaps']} duplicate URLs between pages")
+                yield f"   - {pagination_test['url_overlaps']} duplicate URLs between pages"
         
         # Proxy impact summary  
         proxy_test = results['tests'].get('proxy_impact', {})
         if isinstance(proxy_test, dict):
-            report_lines.extend([
-                "\n🔄 PROXY IMPACT ANALYSIS",
-                "-" * 40
-            ])
+            yield "\n🔄 PROXY IMPACT ANALYSIS"
+            yield "-" * 40
             
             if proxy_test.get('proxy_rotation_detected'):
-                report_lines.append("⚠️  Proxy rotation impact detected")
-                report_lines.append(f"   - Results range: {proxy_test.get('results_count_range', 'N/A')}")
-                report_lines.append(f"   - First result varies: {proxy_test.get('first_result_varies', 'N/A')}")
+                yield "⚠️  Proxy rotation impact detected"
+                yield f"   - Results range: {proxy_test.get('results_count_range', 'N/A')}"
+                yield f"   - First result varies: {proxy_test.get('first_result_varies', 'N/A')}"
             else:
-                report_lines.append("✅ Minimal proxy impact - consistent results")
+                yield "✅ Minimal proxy impact - consistent results"
         
-        report_lines.extend([
-            "\n" + "=" * 60,
-            "📝 Report completed successfully",
-            "=" * 60
-        ])
-        
-        return "\n".join(report_lines)
+        yield "\n" + "=" * 60
+        yield "📝 Report completed successfully"
+        yield "=" * 60
     
     async def close(self):
         """Close the HTTP client."""
@@ -455,17 +559,15 @@ async def main():
                 logger.error("   Please make sure the server is running on http://localhost:8000")
                 return 1
             
-            # Run comprehensive tests
-            results = await tester.run_comprehensive_test()
+            # Run comprehensive tests, streaming detailed results to file as they complete
+            output_file = f"indonesia_fashion_test_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+            with open(output_file, 'wb') as f:
+                results = await tester.run_comprehensive_test(output_file=f)
             
             # Generate and display report
-            report = tester.generate_test_report(results)
-            print(f"\n{report}")
-            
-            # Save detailed results to file
-            output_file = f"indonesia_fashion_test_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, ensure_ascii=False)
+            print()
+            for line in tester.generate_test_report(results):
+                sys.stdout.write(line + "\n")
             
             logger.info(f"\n📄 Detailed results saved to: {output_file}")
             
@@ -482,7 +584,9 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        exit_code = asyncio.run(main())
+        loop_factory = uvloop.new_event_loop if uvloop is not None else None
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            exit_code = runner.run(main())
         sys.exit(exit_code)
     except KeyboardInterrupt:
         print("\n👋 Goodbye!")
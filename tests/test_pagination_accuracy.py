@@ -10,8 +10,17 @@ import asyncio
 import sys
 import os
 import logging
-from typing import Dict, Any, List
-from urllib.parse import parse_qs, urlparse
+import re
+from typing import Any, BinaryIO, Dict, List, Optional
+from urllib.parse import unquote_plus
+
+import numpy as np
+import orjson
+
+try:
+    import uvloop
+except ImportError:  # uvloop is unavailable on Windows
+    uvloop = None
 
 # Add the app directory to the path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'app'))
@@ -31,6 +40,9 @@ logger = logging.getLogger(__name__)
 class PaginationAccuracyTester:
     """Test pagination mathematical accuracy and URL building logic."""
     
+    # Pulls just the query-string parameters the URL checks look at
+    _QS_RE = re.compile(r"[?&](start|num|q|gl)=([^&]*)")
+    
     def __init__(self):
         """Initialize the tester."""
         self.pagination_helper = PaginationHelper()
@@ -70,7 +82,8 @@ class PaginationAccuracyTester:
                     'passed': passed
                 })
                 
-                logger.info(f"{status} Page {page}, {results_per_page}/page → start={actual_start} (expected {expected_start})")
+                logger.info("%s Page %d, %d/page → start=%s (expected %d)",
+                           status, page, results_per_page, actual_start, expected_start)
                 
             except Exception as e:
                 logger.error(f"❌ Error calculating start index for page {page}: {str(e)}")
@@ -134,8 +147,8 @@ class PaginationAccuracyTester:
         
         for test_case in test_cases:
             try:
-                # Create SearchRequest
-                search_request = SearchRequest(
+                # Create SearchRequest (test cases are fixed and valid, so skip validation)
+                search_request = SearchRequest.model_construct(
                     query=test_case['query'],
                     country=test_case['country'],
                     language=test_case['language'],
@@ -146,12 +159,10 @@ class PaginationAccuracyTester:
                 # Build URL using BrightData client logic
                 google_url = self.bright_data_client._build_google_url(search_request)
                 
-                # Parse URL to extract parameters
-                parsed_url = urlparse(google_url)
-                url_params = parse_qs(parsed_url.query)
-                
-                # Extract single values from lists
-                actual_params = {k: v[0] if v else '' for k, v in url_params.items()}
+                # Extract the checked parameters; only the query needs decoding
+                actual_params = dict(self._QS_RE.findall(google_url))
+                if 'q' in actual_params:
+                    actual_params['q'] = unquote_plus(actual_params['q'])
                 expected_params = test_case['expected_params']
                 
                 # Check key parameters
@@ -182,8 +193,9 @@ class PaginationAccuracyTester:
                     'passed': all_params_correct
                 })
                 
-                logger.info(f"{status} Page {test_case['page']} ({test_case['country']}): "
-                           f"start={actual_params.get('start')}, num={actual_params.get('num')}")
+                logger.info("%s Page %d (%s): start=%s, num=%s",
+                           status, test_case['page'], test_case['country'],
+                           actual_params.get('start'), actual_params.get('num'))
                 
                 if not all_params_correct:
                     logger.warning(f"   Expected: start={expected_params['start']}, num={expected_params['num']}")
@@ -243,8 +255,8 @@ class PaginationAccuracyTester:
                     'passed': passed
                 })
                 
-                logger.info(f"{status} {total_results} results, {results_per_page}/page → "
-                           f"{actual_pages} pages (expected {expected_pages})")
+                logger.info("%s %s results, %d/page → %s pages (expected %s)",
+                           status, total_results, results_per_page, actual_pages, expected_pages)
                 
             except Exception as e:
                 logger.error(f"❌ Error calculating total pages: {str(e)}")
@@ -309,8 +321,9 @@ class PaginationAccuracyTester:
                     'passed': passed
                 })
                 
-                logger.info(f"{status} Page {page}, {actual_results} results → "
-                           f"range {actual_start}-{actual_end} (expected {expected_start}-{expected_end})")
+                logger.info("%s Page %d, %d results → range %d-%d (expected %d-%d)",
+                           status, page, actual_results, actual_start, actual_end,
+                           expected_start, expected_end)
                 
             except Exception as e:
                 logger.error(f"❌ Error calculating page range: {str(e)}")
@@ -331,8 +344,58 @@ class PaginationAccuracyTester:
             'passed_tests': sum(1 for r in results if r.get('passed', False))
         }
     
-    def run_all_tests(self) -> Dict[str, Any]:
-        """Run all pagination accuracy tests."""
+    def test_pagination_bulk(self, n: int = 10_000) -> Dict[str, Any]:
+        """Test vectorized pagination calculations over a large page sweep."""
+        logger.info("📈 Testing bulk pagination calculations (%d pages)", n)
+        
+        pages = np.arange(1, n + 1)
+        results_per_page = np.full(n, 100)
+        total_results = np.arange(0, n * 37, 37)
+        
+        expected_starts = (pages - 1) * results_per_page
+        expected_total_pages = -(-total_results // results_per_page)
+        
+        actual_starts = self.pagination_helper.calculate_start_index_batch(pages, results_per_page)
+        actual_total_pages = self.pagination_helper.calculate_total_pages_batch(total_results, results_per_page)
+        
+        # Spot-check the vectorized helpers against the scalar implementations
+        sample = range(0, n, max(n // 100, 1))
+        scalar_matches = all(
+            actual_starts[i] == self.pagination_helper.calculate_start_index(int(pages[i]), 100)
+            and actual_total_pages[i] == self.pagination_helper.calculate_total_pages(int(total_results[i]), 100)
+            for i in sample
+        )
+        
+        start_mismatches = int(np.count_nonzero(actual_starts != expected_starts))
+        total_pages_mismatches = int(np.count_nonzero(actual_total_pages != expected_total_pages))
+        all_passed = start_mismatches == 0 and total_pages_mismatches == 0 and scalar_matches
+        
+        status = "✅" if all_passed else "❌"
+        logger.info("%s %d pages → start mismatches=%d, total pages mismatches=%d, scalar agreement=%s",
+                   status, n, start_mismatches, total_pages_mismatches, scalar_matches)
+        
+        return {
+            'test_name': 'pagination_bulk',
+            'all_passed': all_passed,
+            'test_cases': [{
+                'pages': n,
+                'start_mismatches': start_mismatches,
+                'total_pages_mismatches': total_pages_mismatches,
+                'scalar_matches': scalar_matches,
+                'passed': all_passed
+            }],
+            'total_tests': 1,
+            'passed_tests': int(all_passed)
+        }
+    
+    async def run_all_tests(self, output_file: Optional[BinaryIO] = None) -> Dict[str, Any]:
+        """
+        Run all pagination accuracy tests, each category in its own worker thread.
+        
+        When ``output_file`` is given, each category's full result is written to it
+        as a JSONL record as soon as the category finishes, and only its pass counts
+        are kept in the returned summary.
+        """
         logger.info("🚀 Starting pagination mathematical accuracy test suite")
         logger.info("=" * 70)
         
@@ -346,28 +409,52 @@ class PaginationAccuracyTester:
             self.test_pagination_calculations,
             self.test_url_building_logic,
             self.test_total_pages_calculation,
-            self.test_page_range_calculation
+            self.test_page_range_calculation,
+            self.test_pagination_bulk
         ]
         
         overall_success = True
         
-        for test_func in tests:
+        async def run_category(test_func):
             try:
-                logger.info(f"\n--- {test_func.__name__.replace('test_', '').replace('_', ' ').title()} ---")
-                test_result = test_func()
-                test_suite_results['tests'][test_result['test_name']] = test_result
-                overall_success &= test_result['all_passed']
-                
-                logger.info(f"Result: {test_result['passed_tests']}/{test_result['total_tests']} tests passed")
-                
+                return test_func, await asyncio.to_thread(test_func)
             except Exception as e:
-                logger.error(f"❌ Test function {test_func.__name__} failed: {str(e)}")
+                return test_func, e
+        
+        # Categories are independent, so run them concurrently and record each as it finishes
+        for next_done in asyncio.as_completed([run_category(test_func) for test_func in tests]):
+            test_func, outcome = await next_done
+            
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("\n--- %s ---", test_func.__name__.replace('test_', '').replace('_', ' ').title())
+            
+            if isinstance(outcome, Exception):
+                logger.error(f"❌ Test function {test_func.__name__} failed: {str(outcome)}")
                 overall_success = False
                 test_suite_results['tests'][test_func.__name__] = {
-                    'error': str(e),
+                    'error': str(outcome),
                     'all_passed': False
                 }
+                continue
+            
+            overall_success &= outcome['all_passed']
+            logger.info("Result: %d/%d tests passed", outcome['passed_tests'], outcome['total_tests'])
+            
+            if output_file is None:
+                test_suite_results['tests'][outcome['test_name']] = outcome
+                continue
+            
+            await self._write_record(output_file, outcome)
+            test_suite_results['tests'][outcome['test_name']] = {
+                key: outcome[key] for key in ('all_passed', 'total_tests', 'passed_tests')
+            }
         
+        # Completion order varies; report categories in declaration order
+        order = {test_func.__name__.replace('test_', '', 1): i for i, test_func in enumerate(tests)}
+        test_suite_results['tests'] = dict(sorted(
+            test_suite_results['tests'].items(),
+            key=lambda item: order.get(item[0].replace('test_', '', 1), len(order))
+        ))
         test_suite_results['overall_success'] = overall_success
         
         # Generate summary
@@ -383,6 +470,17 @@ class PaginationAccuracyTester:
         logger.info("=" * 70)
         
         return test_suite_results
+    
+    @staticmethod
+    async def _write_record(output_file: BinaryIO, record: Dict[str, Any]) -> None:
+        """Append one JSONL record to ``output_file`` without blocking the event loop."""
+        line = orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY)
+        
+        def write_line():
+            output_file.write(line)
+            output_file.flush()
+        
+        await asyncio.to_thread(write_line)
 
 
 async def main():
@@ -393,16 +491,15 @@ async def main():
     tester = PaginationAccuracyTester()
     
     try:
-        # Run all tests
-        results = tester.run_all_tests()
-        
-        # Save results to file
-        import json
         from datetime import datetime
         
-        output_file = f"pagination_accuracy_test_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        # Run all tests, streaming each category's results to a JSONL file
+        output_file = f"pagination_accuracy_test_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+        with open(output_file, 'wb') as f:
+            results = await tester.run_all_tests(output_file=f)
+            
+            # Close with the suite summary record
+            await tester._write_record(f, results)
         
         logger.info(f"\n📄 Detailed results saved to: {output_file}")
         
@@ -418,7 +515,9 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        exit_code = asyncio.run(main())
+        loop_factory = uvloop.new_event_loop if uvloop is not None else None
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            exit_code = runner.run(main())
         sys.exit(exit_code)
     except Exception as e:
         logger.error(f"Test runner failed: {str(e)}")
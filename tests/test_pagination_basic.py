@@ -4,7 +4,6 @@ Quick test script for pagination functionality.
 Run this to verify the pagination enhancements are working correctly.
 """
 
-import asyncio
 import sys
 import os
 import logging
@@ -79,6 +78,12 @@ def test_pagination_utilities():
         expected = 10  # ceil(95/10) = 10
         assert total_pages == expected, f"Expected {expected}, got {total_pages}"
         print(f"✅ calculate_total_pages: 95 results → {total_pages} pages")
+        
+        # Edge cases: no results, exactly one full page, and very large totals
+        for total, per_page, expected in [(0, 10, 0), (10, 10, 1), (10**12, 100, 10**10), (10**12 + 1, 100, 10**10 + 1)]:
+            total_pages = helper.calculate_total_pages(total_results=total, results_per_page=per_page)
+            assert total_pages == expected, f"Expected {expected} for {total}/{per_page}, got {total_pages}"
+        print("✅ calculate_total_pages: edge cases (0, exact page, 10**12) correct")
     except Exception as e:
         print(f"❌ calculate_total_pages failed: {str(e)}")
         return False
@@ -94,6 +99,15 @@ def test_pagination_utilities():
         print(f"❌ extract_total_results_from_text failed: {str(e)}")
         return False
     
+    # Test extraction with the "Showing" pattern and with no count at all
+    try:
+        assert helper.extract_total_results_from_text("Showing 1-10 of 2,500") == 2500
+        assert helper.extract_total_results_from_text("No count here") is None
+        print("✅ extract_total_results_from_text: 'Showing' pattern and no-match case")
+    except Exception as e:
+        print(f"❌ extract_total_results_from_text edge cases failed: {str(e)}")
+        return False
+    
     # Test generate_pagination_metadata
     try:
         pagination = helper.generate_pagination_metadata(
@@ -177,7 +191,7 @@ def test_url_building():
     return True
 
 
-async def main():
+def main():
     """Run all pagination tests."""
     print("🚀 Testing Enhanced Pagination Functionality")
     print("=" * 60)
@@ -219,7 +233,7 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        exit_code = asyncio.run(main())
+        exit_code = main()
         sys.exit(exit_code)
     except KeyboardInterrupt:
         print("\n👋 Tests interrupted by user")
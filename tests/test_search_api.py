@@ -1,12 +1,17 @@
 """Tests for the search API endpoints."""
 
+import asyncio
+import logging
+import os
+import time
 import pytest
-import json
-from unittest.mock import AsyncMock, patch, MagicMock
-from fastapi.testclient import TestClient
+import pytest_asyncio
+import orjson
+from unittest.mock import AsyncMock, patch
 from datetime import datetime, UTC
+from pydantic import HttpUrl, ValidationError
 
-from main import create_app
+from app.routers.search import get_serp_service_factory
 from app.models.serp import SearchRequest, SearchResponse, SearchResult, BatchPaginationResponse, PageResult, BatchPaginationSummary
 from app.clients.bright_data import (
     BrightDataError,
@@ -14,81 +19,158 @@ from app.clients.bright_data import (
     BrightDataTimeoutError
 )
 
+logger = logging.getLogger(__name__)
+
+JSON_HEADERS = {"content-type": "application/json"}
+
+# Mock responses only need some timestamp; no test asserts on its value
+_FIXED_TS = datetime(2024, 1, 1, tzinfo=UTC)
+
+# Country/language pairs exercised by the i18n tests
+I18N_CASES = [
+    ("GB", "en"),
+    ("FR", "fr"),
+    ("DE", "de"),
+    ("JP", "ja"),
+]
+
+
+def _payload_id(payload):
+    """Readable parametrize id for a request payload, e.g. ``query=test,page=0``."""
+    return ",".join(f"{key}={value}" for key, value in payload.items()) or "empty"
+
+
+def _post(client, body):
+    """POST a search request; ``body`` is a payload dict or JSON bytes already encoded with orjson."""
+    if not isinstance(body, bytes):
+        body = orjson.dumps(body)
+    return client.post("/api/v1/search", content=body, headers=JSON_HEADERS)
 
-@pytest.fixture
-def client():
-    """Create test client."""
-    app = create_app()
-    return TestClient(app)
+
+def _result(rank, title, url, description=None):
+    """Trusted mock result; only the URL is validated so it serializes as HttpUrl."""
+    return SearchResult.model_construct(rank=rank, title=title, url=HttpUrl(url), description=description)
+
+
+# Built once at import without re-validating; tests get deep copies since the router mutates responses
+_RESPONSE = SearchResponse.model_construct(
+    query="test query",
+    results_count=2,
+    organic_results=[
+        _result(
+            rank=1,
+            title="Test Result 1",
+            url="https://example.com/1",
+            description="Test description 1"
+        ),
+        _result(
+            rank=2,
+            title="Test Result 2", 
+            url="https://example.com/2",
+            description="Test description 2"
+        )
+    ],
+    timestamp=_FIXED_TS,
+    search_metadata={
+        "search_time": 0.5,
+        "country": "US",
+        "language": "en"
+    }
+)
+
+
+# Two pages of ten results for the multi-page mocks; merged ranks run 1..20 continuously
+_PAGE1_RESULTS = tuple(
+    _result(rank=i, title=f"Result {i}", url=f"https://example.com/{i}", description=f"Description {i}")
+    for i in range(1, 11)
+)
+_PAGE2_RESULTS = tuple(
+    _result(rank=i, title=f"Result {i}", url=f"https://example.com/{i}", description=f"Description {i}")
+    for i in range(11, 21)
+)
+
+
+# Default answer for tests that only care whether a request got past validation
+_EMPTY_RESPONSE = SearchResponse.model_construct(
+    query="test",
+    results_count=0,
+    organic_results=[],
+    timestamp=_FIXED_TS,
+    search_metadata={}
+)
 
 
 @pytest.fixture
 def mock_search_response():
-    """Create mock search response."""
-    return SearchResponse(
-        query="test query",
-        results_count=2,
-        organic_results=[
-            SearchResult(
-                rank=1,
-                title="Test Result 1",
-                url="https://example.com/1",
-                description="Test description 1"
-            ),
-            SearchResult(
-                rank=2,
-                title="Test Result 2", 
-                url="https://example.com/2",
-                description="Test description 2"
-            )
-        ],
-        timestamp=datetime.now(UTC),
-        search_metadata={
-            "search_time": 0.5,
-            "country": "US",
-            "language": "en"
-        }
-    )
+    """Fresh copy of the mock search response; the router adds request metadata to what the service returns."""
+    return _RESPONSE.model_copy(deep=True)
+
 
+def _assert_ok(data, expected):
+    """Assert a successful search payload mirrors the response the service returned."""
+    assert data["query"] == expected.query
+    assert data["results_count"] == expected.results_count
+    assert len(data["organic_results"]) == len(expected.organic_results)
+    assert data["organic_results"][0]["title"] == expected.organic_results[0].title
+    assert data["organic_results"][0]["url"] == str(expected.organic_results[0].url)
+    assert "timestamp" in data
+    assert "search_metadata" in data
 
+
+@pytest.fixture(scope="class")
+def search_patch():
+    """Patch SERPService.search once per test class."""
+    with patch('app.services.serp_service.SERPService.search', new_callable=AsyncMock) as mock:
+        yield mock
+
+
+@pytest.fixture
+def mock_search(search_patch):
+    """Hand each test the shared search mock and clear it afterwards."""
+    search_patch.return_value = _EMPTY_RESPONSE.model_copy(deep=True)
+    yield search_patch
+    search_patch.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client(client):
+    """The shared client, after building the OpenAPI schema and request validation once.
+    
+    Extends conftest's ``client`` rather than being autouse, so the model-only
+    tests below never import the app.
+    """
+    await client.get("/openapi.json")
+    await _post(client, b"{}")
+    return client
+
+
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.usefixtures("mock_search")
 class TestSearchEndpoint:
     """Test cases for the /api/v1/search endpoint."""
     
-    def test_search_endpoint_exists(self, client):
+    async def test_search_endpoint_exists(self, client):
         """Test that the search endpoint is accessible."""
         # Test with invalid data to ensure endpoint exists
-        response = client.post("/api/v1/search", json={})
+        response = await _post(client, {})
         assert response.status_code in [400, 422]  # Should fail validation, not 404
     
-    @patch('app.services.serp_service.SERPService.search')
-    def test_search_success(self, mock_search, client, mock_search_response):
-        """Test successful search request."""
+    @pytest.mark.parametrize("request_data", [
+        pytest.param({"query": "test query", "country": "US", "language": "en", "page": 1}, id="explicit"),
+        pytest.param({"query": "test query"}, id="defaults"),
+    ])
+    async def test_search_happy_path(self, client, mock_search, mock_search_response, request_data):
+        """Test successful search requests, with explicit and with default parameters."""
         # Setup mock
         mock_search.return_value = mock_search_response
         
-        # Make request
-        request_data = {
-            "query": "test query",
-            "country": "US",
-            "language": "en",
-            "page": 1
-        }
-        
-        response = client.post("/api/v1/search", json=request_data)
+        response = await _post(client, request_data)
         
         # Assertions
         assert response.status_code == 200
+        _assert_ok(response.json(), mock_search_response)
         
-        data = response.json()
-        assert data["query"] == "test query"
-        assert data["results_count"] == 2
-        assert len(data["organic_results"]) == 2
-        assert data["organic_results"][0]["title"] == "Test Result 1"
-        assert data["organic_results"][0]["url"] == "https://example.com/1"
-        assert "timestamp" in data
-        assert "search_metadata" in data
-        
-        # Verify mock was called correctly
+        # Verify mock was called once with the explicit (or default) parameters
         mock_search.assert_called_once()
         call_args = mock_search.call_args[0][0]
         assert call_args.query == "test query"
@@ -96,193 +178,149 @@ class TestSearchEndpoint:
         assert call_args.language == "en"
         assert call_args.page == 1
     
-    @patch('app.services.serp_service.SERPService.search')
-    def test_search_with_defaults(self, mock_search, client, mock_search_response):
-        """Test search request with default parameters."""
-        # Setup mock
-        mock_search.return_value = mock_search_response
-        
-        # Make request with minimal data
-        request_data = {"query": "test query"}
-        
-        response = client.post("/api/v1/search", json=request_data)
-        
-        # Assertions
-        assert response.status_code == 200
-        
-        # Verify defaults were applied
-        call_args = mock_search.call_args[0][0]
-        assert call_args.query == "test query"
-        assert call_args.country == "US"  # Default
-        assert call_args.language == "en"  # Default  
-        assert call_args.page == 1  # Default
-    
-    def test_search_validation_error_empty_query(self, client):
-        """Test validation error for empty query."""
-        request_data = {"query": ""}
-        
-        response = client.post("/api/v1/search", json=request_data)
-        
-        assert response.status_code == 422
-        data = response.json()
-        assert "validation_error" in data["type"]
-        assert any("min_length" in str(error) for error in data["details"])
-    
-    def test_search_validation_error_invalid_country(self, client):
-        """Test validation error for invalid country code."""
-        request_data = {
-            "query": "test",
-            "country": "usa"  # Should be 2-letter uppercase
-        }
-        
-        response = client.post("/api/v1/search", json=request_data)
-        
-        assert response.status_code == 422
-        data = response.json()
-        assert "validation_error" in data["type"]
-    
-    def test_search_validation_error_invalid_language(self, client):
-        """Test validation error for invalid language code."""
-        request_data = {
-            "query": "test",
-            "language": "EN"  # Should be 2-letter lowercase
-        }
-        
-        response = client.post("/api/v1/search", json=request_data)
+    async def test_search_validation_error(self, client):
+        """Test an invalid request is answered with the API's 422 validation error envelope."""
+        response = await _post(client, {"query": ""})
         
         assert response.status_code == 422
         data = response.json()
         assert "validation_error" in data["type"]
+        assert any(error.get("type") == "string_too_short" for error in data["details"])
     
-    def test_search_validation_error_invalid_page(self, client):
-        """Test validation error for invalid page number."""
-        request_data = {
-            "query": "test",
-            "page": 0  # Should be >= 1
-        }
-        
-        response = client.post("/api/v1/search", json=request_data)
-        
-        assert response.status_code == 422
-        data = response.json()
-        assert "validation_error" in data["type"]
-    
-    @patch('app.services.serp_service.SERPService.search')
-    def test_search_rate_limit_error(self, mock_search, client):
+    async def test_search_rate_limit_error(self, client, mock_search):
         """Test rate limit error handling."""
         # Setup mock to raise rate limit error
         mock_search.side_effect = BrightDataRateLimitError("Rate limit exceeded")
         
         request_data = {"query": "test query"}
         
-        response = client.post("/api/v1/search", json=request_data)
+        response = await _post(client, request_data)
         
         assert response.status_code == 429
+        assert "Retry-After" in response.headers
         data = response.json()
         assert data["error"] == "Rate limit exceeded"
         assert data["type"] == "rate_limit_error"
-        assert "Retry-After" in response.headers
     
-    @patch('app.services.serp_service.SERPService.search')
-    def test_search_timeout_error(self, mock_search, client):
+    async def test_search_timeout_error(self, client, mock_search):
         """Test timeout error handling."""
         # Setup mock to raise timeout error
         mock_search.side_effect = BrightDataTimeoutError("Request timeout")
         
         request_data = {"query": "test query"}
         
-        response = client.post("/api/v1/search", json=request_data)
+        response = await _post(client, request_data)
         
         assert response.status_code == 504
         data = response.json()
         assert data["error"] == "Request timeout"
         assert data["type"] == "timeout_error"
     
-    @patch('app.services.serp_service.SERPService.search')
-    def test_search_api_error(self, mock_search, client):
+    async def test_search_api_error(self, client, mock_search):
         """Test API error handling."""
         # Setup mock to raise API error
         mock_search.side_effect = BrightDataError("API error")
         
         request_data = {"query": "test query"}
         
-        response = client.post("/api/v1/search", json=request_data)
+        response = await _post(client, request_data)
         
         assert response.status_code == 502
         data = response.json()
         assert data["error"] == "External API error"
         assert data["type"] == "api_error"
     
-    @patch('app.services.serp_service.SERPService.search')
-    def test_search_unexpected_error(self, mock_search, client):
+    async def test_search_unexpected_error(self, client, mock_search):
         """Test unexpected error handling."""
         # Setup mock to raise unexpected error
         mock_search.side_effect = Exception("Unexpected error")
         
         request_data = {"query": "test query"}
         
-        response = client.post("/api/v1/search", json=request_data)
+        response = await _post(client, request_data)
         
         assert response.status_code == 500
         data = response.json()
         assert data["error"] == "Internal server error"
         assert data["type"] == "server_error"
     
-    def test_search_missing_query(self, client):
-        """Test request with missing query field."""
-        request_data = {}
+    @pytest.mark.parametrize("country,language", I18N_CASES)
+    async def test_search_different_countries_languages(self, client, mock_search, mock_search_response, country, language):
+        """Test search with different country and language combinations."""
+        # Setup mock
+        mock_search.return_value = mock_search_response
         
-        response = client.post("/api/v1/search", json=request_data)
+        response = await _post(client, {"query": "test", "country": country, "language": language})
+        assert response.status_code == 200
         
-        assert response.status_code == 422
-        data = response.json()
-        assert "validation_error" in data["type"]
+        # Verify correct parameters were passed
+        call_args = mock_search.call_args[0][0]
+        assert call_args.country == country
+        assert call_args.language == language
     
-    @patch('app.services.serp_service.SERPService.search')
-    def test_search_different_countries_languages(self, mock_search, client, mock_search_response):
-        """Test search with different country and language combinations."""
+    async def test_search_i18n_batched(self, client, mock_search, mock_search_response):
+        """Test all country/language combinations sent concurrently in one batch."""
         # Setup mock
         mock_search.return_value = mock_search_response
         
-        test_cases = [
-            {"query": "test", "country": "GB", "language": "en"},
-            {"query": "test", "country": "FR", "language": "fr"},
-            {"query": "test", "country": "DE", "language": "de"},
-            {"query": "test", "country": "JP", "language": "ja"},
-        ]
+        responses = await asyncio.gather(*(
+            _post(client, {"query": "test", "country": country, "language": language})
+            for country, language in I18N_CASES
+        ))
+        assert [response.status_code for response in responses] == [200] * len(I18N_CASES)
         
-        for case in test_cases:
-            response = client.post("/api/v1/search", json=case)
-            assert response.status_code == 200
-            
-            # Verify correct parameters were passed
-            call_args = mock_search.call_args[0][0]
-            assert call_args.country == case["country"]
-            assert call_args.language == case["language"]
+        # Every pair reached the service exactly once, in whatever order the loop ran them
+        seen = sorted((call.args[0].country, call.args[0].language) for call in mock_search.call_args_list)
+        assert seen == sorted(I18N_CASES)
     
-    @patch('app.services.serp_service.SERPService.search')
-    def test_search_pagination(self, mock_search, client, mock_search_response):
+    @pytest.mark.parametrize("page", [1, 2, 5, 10])
+    async def test_search_pagination(self, client, mock_search, mock_search_response, page):
         """Test search with different page numbers."""
         # Setup mock
         mock_search.return_value = mock_search_response
         
-        for page in [1, 2, 5, 10]:
-            request_data = {"query": "test", "page": page}
-            response = client.post("/api/v1/search", json=request_data)
-            
-            assert response.status_code == 200
-            
-            # Verify correct page was passed
-            call_args = mock_search.call_args[0][0]
-            assert call_args.page == page
+        response = await _post(client, {"query": "test", "page": page})
+        assert response.status_code == 200
+        
+        # Verify correct page was passed
+        call_args = mock_search.call_args[0][0]
+        assert call_args.page == page
+    
+    @pytest.mark.slow
+    async def test_search_post_latency(self, client, mock_search, mock_search_response):
+        """Measure in-process request handling for the happy path.
+        
+        Run with ``-m slow --log-cli-level=INFO`` to see the figure. Timings depend on
+        the machine, so a budget is only enforced when SEARCH_LATENCY_BUDGET_MS is set.
+        """
+        mock_search.return_value = mock_search_response
+        body = orjson.dumps({"query": "test query"})
+        
+        # Warm up routing, middleware and serializer caches before timing
+        for _ in range(20):
+            await _post(client, body)
+        
+        iterations = 200
+        start = time.perf_counter()
+        for _ in range(iterations):
+            response = await _post(client, body)
+        per_request = (time.perf_counter() - start) / iterations
+        
+        assert response.status_code == 200
+        logger.info("/api/v1/search happy path: %.3f ms/request over %d requests", per_request * 1000, iterations)
+        
+        budget_ms = os.environ.get("SEARCH_LATENCY_BUDGET_MS")
+        if budget_ms is not None:
+            assert per_request * 1000 < float(budget_ms)
 
 
+@pytest.mark.asyncio(loop_scope="session")
 class TestSearchStatusEndpoint:
     """Test cases for the /api/v1/search/status endpoint."""
     
-    def test_search_status_success(self, client):
+    async def test_search_status_success(self, client):
         """Test successful search status check."""
-        response = client.get("/api/v1/search/status")
+        response = await client.get("/api/v1/search/status")
         
         assert response.status_code == 200
         data = response.json()
@@ -290,13 +328,20 @@ class TestSearchStatusEndpoint:
         assert "status" in data
         assert "dependencies" in data
     
-    @patch('app.services.serp_service.SERPService.__init__')
-    def test_search_status_service_error(self, mock_init, client):
+    @pytest.fixture
+    def failing_service_factory(self, app):
+        """Make the status endpoint's service construction fail, restoring it afterwards."""
+        def factory():
+            raise Exception("Service initialization failed")
+        
+        app.dependency_overrides[get_serp_service_factory] = lambda: factory
+        yield factory
+        app.dependency_overrides.pop(get_serp_service_factory, None)
+    
+    @pytest.mark.usefixtures("failing_service_factory")
+    async def test_search_status_service_error(self, client):
         """Test search status when service initialization fails."""
-        # Setup mock to raise error
-        mock_init.side_effect = Exception("Service initialization failed")
-        
-        response = client.get("/api/v1/search/status")
+        response = await client.get("/api/v1/search/status")
         
         assert response.status_code == 503
         data = response.json()
@@ -305,30 +350,31 @@ class TestSearchStatusEndpoint:
         assert "error" in data
 
 
+@pytest.mark.asyncio(loop_scope="session")
 class TestSearchIntegration:
     """Integration tests for the search functionality."""
     
     @patch('app.clients.bright_data.BrightDataClient.search')
-    def test_full_integration_mock(self, mock_client_search, client):
+    async def test_full_integration_mock(self, mock_client_search, client):
         """Test full integration with mocked Bright Data client."""
         # Create a realistic mock response from the client
-        mock_client_response = SearchResponse(
+        mock_client_response = SearchResponse.model_construct(
             query="python programming",
             results_count=3,
             organic_results=[
-                SearchResult(
+                _result(
                     rank=1,
                     title="Learn Python Programming",
                     url="https://python.org/learn",
                     description="Official Python learning resources"
                 ),
-                SearchResult(
+                _result(
                     rank=2,
                     title="Python Tutorial for Beginners",
                     url="https://tutorial.python.org",
                     description="Comprehensive Python tutorial"
                 ),
-                SearchResult(
+                _result(
                     rank=3,
                     title="Python Documentation",
                     url="https://docs.python.org",
@@ -348,15 +394,13 @@ class TestSearchIntegration:
             "page": 1
         }
         
-        response = client.post("/api/v1/search", json=request_data)
+        response = await _post(client, request_data)
         
         # Assertions
         assert response.status_code == 200
         
         data = response.json()
-        assert data["query"] == "python programming"
-        assert data["results_count"] == 3
-        assert len(data["organic_results"]) == 3
+        _assert_ok(data, mock_client_response)
         
         # Check that service enhanced the response
         assert "search_time" in data["search_metadata"]
@@ -372,17 +416,19 @@ class TestSearchIntegration:
         assert search_request.page == 1
 
 
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.usefixtures("mock_search")
 class TestMultiPageSearch:
     """Test multi-page search functionality through the unified endpoint."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def mock_batch_response(self):
-        """Create mock batch pagination response."""
-        return BatchPaginationResponse(
+        """Create mock batch pagination response (read-only, shared across the class)."""
+        return BatchPaginationResponse.model_construct(
             query="test multi-page",
             total_results=20,
             pages_fetched=2,
-            pagination_summary=BatchPaginationSummary(
+            pagination_summary=BatchPaginationSummary.model_construct(
                 total_results_estimate=1000000,
                 results_per_page=10,
                 pages_requested=2,
@@ -392,32 +438,23 @@ class TestMultiPageSearch:
                 batch_processing_time=2.5
             ),
             pages=[
-                PageResult(
+                PageResult.model_construct(
                     page_number=1,
                     results_count=10,
-                    organic_results=[
-                        SearchResult(rank=i, title=f"Result {i}", url=f"https://example.com/{i}", description=f"Description {i}")
-                        for i in range(1, 11)
-                    ]
+                    organic_results=list(_PAGE1_RESULTS)
                 ),
-                PageResult(
+                PageResult.model_construct(
                     page_number=2,
                     results_count=10,
-                    organic_results=[
-                        SearchResult(rank=i, title=f"Result {i}", url=f"https://example.com/{i}", description=f"Description {i}")
-                        for i in range(11, 21)
-                    ]
+                    organic_results=list(_PAGE2_RESULTS)
                 )
             ],
-            merged_results=[
-                SearchResult(rank=i, title=f"Result {i}", url=f"https://example.com/{i}", description=f"Description {i}")
-                for i in range(1, 21)
-            ],
-            timestamp=datetime.now(UTC)
+            merged_results=list(_PAGE1_RESULTS + _PAGE2_RESULTS),
+            timestamp=_FIXED_TS
         )
     
     @patch('app.services.batch_pagination_service.BatchPaginationService.fetch_batch_pages')
-    def test_multi_page_search_success(self, mock_batch_fetch, client, mock_batch_response):
+    async def test_multi_page_search_success(self, mock_batch_fetch, client, mock_batch_response):
         """Test successful multi-page search request."""
         # Setup mock
         mock_batch_fetch.return_value = mock_batch_response
@@ -431,7 +468,7 @@ class TestMultiPageSearch:
             "results_per_page": 10
         }
         
-        response = client.post("/api/v1/search", json=request_data)
+        response = await _post(client, request_data)
         
         # Assertions
         assert response.status_code == 200
@@ -457,37 +494,10 @@ class TestMultiPageSearch:
         assert call_args.query == "test multi-page"
         assert call_args.max_pages == 2
     
-    def test_multi_page_request_validation(self, client):
-        """Test validation for multi-page requests."""
-        # Test valid multi-page requests
-        valid_requests = [
-            {"query": "test", "max_pages": 2},
-            {"query": "test", "max_pages": 3, "start_page": 2},
-            {"query": "test", "max_pages": 1},  # Edge case: max_pages=1 is still valid
-        ]
-        
-        for request_data in valid_requests:
-            response = client.post("/api/v1/search", json=request_data)
-            assert response.status_code != 422, f"Request failed validation: {request_data}"
-    
-    def test_multi_page_request_invalid_data(self, client):
-        """Test invalid multi-page request data."""
-        invalid_requests = [
-            {"query": "test", "max_pages": 0},  # Invalid: max_pages too low
-            {"query": "test", "max_pages": 11},  # Invalid: max_pages too high
-            {"query": "test", "start_page": 2},  # Invalid: start_page without max_pages
-            {"query": "test", "max_pages": -1},  # Invalid: negative max_pages
-        ]
-        
-        for request_data in invalid_requests:
-            response = client.post("/api/v1/search", json=request_data)
-            assert response.status_code == 422, f"Request should have failed validation: {request_data}"
-    
-    @patch('app.services.serp_service.SERPService.search')
-    def test_single_page_vs_multi_page_routing(self, mock_single_search, client, mock_search_response):
+    async def test_single_page_vs_multi_page_routing(self, client, mock_search, mock_search_response):
         """Test that requests are properly routed to single vs multi-page services."""
         # Setup mock for single-page
-        mock_single_search.return_value = mock_search_response
+        mock_search.return_value = mock_search_response
         
         # Test single-page request (no max_pages)
         single_request = {
@@ -495,7 +505,7 @@ class TestMultiPageSearch:
             "page": 2
         }
         
-        response = client.post("/api/v1/search", json=single_request)
+        response = await _post(client, single_request)
         assert response.status_code == 200
         
         data = response.json()
@@ -504,46 +514,49 @@ class TestMultiPageSearch:
         assert data["pages"] is None
         
         # Verify single-page service was called
-        mock_single_search.assert_called_once()
+        mock_search.assert_called_once()
 
 
 class TestRequestResponseModels:
-    """Test the request and response models work correctly with the API."""
+    """Test SearchRequest validation directly; no app, client or service mock involved."""
     
-    def test_search_request_model_validation(self, client):
-        """Test that SearchRequest model validation works through the API."""
-        valid_requests = [
+    @pytest.mark.parametrize("payload", [
+        pytest.param(payload, id=_payload_id(payload)) for payload in [
             {"query": "test", "country": "US", "language": "en", "page": 1},
             {"query": "test"},  # Uses defaults
             {"query": "test", "country": "GB"},
             {"query": "test", "language": "fr"},
             {"query": "test", "page": 5},
             {"query": "test", "max_pages": 2},  # Multi-page request
+            {"query": "test", "max_pages": 3, "start_page": 2},
+            {"query": "test", "max_pages": 1},  # Edge case: max_pages=1 is still valid
         ]
-        
-        for request_data in valid_requests:
-            response = client.post("/api/v1/search", json=request_data)
-            # Should not fail validation (might fail for other reasons)
-            assert response.status_code != 422
+    ])
+    def test_search_request_model_validation(self, payload):
+        """Test valid payloads build a SearchRequest."""
+        SearchRequest.model_validate(payload)
     
-    def test_search_request_invalid_data(self, client):
-        """Test invalid request data is properly rejected."""
-        invalid_requests = [
-            {"query": ""},  # Empty query
-            {"query": "test", "country": "usa"},  # Invalid country format
-            {"query": "test", "language": "EN"},  # Invalid language format
-            {"query": "test", "page": 0},  # Invalid page number
-            {"query": "test", "page": -1},  # Negative page number
-            {"country": "US"},  # Missing query
-            {"query": "test", "max_pages": 0},  # Invalid max_pages
-            {"query": "test", "start_page": 2},  # start_page without max_pages
+    @pytest.mark.parametrize("payload,expected_loc,expected_type", [
+        pytest.param(payload, loc, error_type, id=_payload_id(payload)) for payload, loc, error_type in [
+            ({"query": ""}, ("query",), "string_too_short"),  # Empty query
+            ({"country": "US"}, ("query",), "missing"),  # Missing query
+            ({"query": "test", "country": "usa"}, ("country",), "value_error"),  # Should be 2-letter uppercase
+            ({"query": "test", "language": "EN"}, ("language",), "value_error"),  # Should be 2-letter lowercase
+            ({"query": "test", "page": 0}, ("page",), "greater_than_equal"),  # Should be >= 1
+            ({"query": "test", "page": -1}, ("page",), "greater_than_equal"),
+            ({"query": "test", "max_pages": 0}, ("max_pages",), "greater_than_equal"),
+            ({"query": "test", "max_pages": -1}, ("max_pages",), "greater_than_equal"),
+            ({"query": "test", "max_pages": 11}, ("max_pages",), "less_than_equal"),
+            ({"query": "test", "start_page": 2}, ("start_page",), "value_error"),  # start_page without max_pages
         ]
-        
-        for request_data in invalid_requests:
-            response = client.post("/api/v1/search", json=request_data)
-            assert response.status_code == 422
-            data = response.json()
-            assert data["type"] == "validation_error"
+    ])
+    def test_search_request_invalid_data(self, payload, expected_loc, expected_type):
+        """Test invalid payloads are rejected on the offending field."""
+        with pytest.raises(ValidationError) as exc_info:
+            SearchRequest.model_validate(payload)
+        
+        errors = exc_info.value.errors()
+        assert any(error["loc"] == expected_loc and error["type"] == expected_type for error in errors), errors
 
 
 if __name__ == "__main__":
